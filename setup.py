@@ -96,6 +96,10 @@ setup(
             "pyinstaller>=5.0.0",
             "auto-py-to-exe>=2.20.0",
         ],
+        "speedups": [
+            "orjson>=3.0.0",
+            "ciso8601>=2.2.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -2,9 +2,144 @@
 Detector de proyectos para identificar automáticamente proyectos que usan Tabula Cloud Sync.
 """
 
+import mmap
+import os
 import sys
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# Directorios que nunca contienen servicios del proyecto
+_SKIP_DIRS = frozenset(
+    {"__pycache__", "venv", "env", "node_modules", "build", "dist"}
+)
+
+# Bytes leídos de cada archivo al buscar servicios: la clase y sus
+# métodos principales aparecen al comienzo del módulo
+_SERVICE_SCAN_BYTES = 65536
+
+# Marca de "todavía no detectado" (None es un resultado válido)
+_UNSET = object()
+
+
+def _scan_dir(path: str) -> Tuple[List[str], List[str]]:
+    """
+    Lista un directorio con os.scandir.
+
+    Omite directorios ocultos (.git, .venv, ...) y los de _SKIP_DIRS, y no
+    sigue enlaces simbólicos a directorios.
+
+    Returns:
+        Tupla (subdirectorios a recorrer, archivos .py)
+    """
+    subdirs = []
+    py_files = []
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return subdirs, py_files
+    with entries:
+        for entry in entries:
+            name = entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if name[0] != "." and name not in _SKIP_DIRS:
+                        subdirs.append(entry.path)
+                elif name.endswith(".py"):
+                    py_files.append(entry.path)
+            except OSError:
+                continue
+    return subdirs, py_files
+
+
+def _iter_py_files(
+    root: str, executor: Optional[Executor] = None
+) -> Iterator[str]:
+    """
+    Recorre recursivamente los archivos .py bajo root.
+
+    El árbol se recorre por niveles; con un executor, los directorios de
+    cada nivel se listan en paralelo (os.scandir libera el GIL).
+
+    Args:
+        root: Directorio desde el cual buscar
+        executor: Pool opcional para listar directorios en paralelo
+
+    Yields:
+        Ruta de cada archivo .py encontrado
+    """
+    map_dirs = executor.map if executor is not None else map
+    level = [root]
+    while level:
+        next_level = []
+        for subdirs, py_files in map_dirs(_scan_dir, level):
+            next_level.extend(subdirs)
+            yield from py_files
+        level = next_level
+
+
+def _file_contains(path: str, markers: Iterable[bytes]) -> bool:
+    """
+    Indica si el comienzo del archivo contiene todas las marcas.
+
+    El archivo se mapea en memoria y se busca directamente sobre la caché
+    de páginas del sistema, sin copiar su contenido. Solo se revisan los
+    primeros _SERVICE_SCAN_BYTES bytes.
+    """
+    try:
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = min(len(mm), _SERVICE_SCAN_BYTES)
+                return all(mm.find(marker, 0, end) >= 0 for marker in markers)
+    except (OSError, ValueError):
+        # ValueError: archivo vacío, no se puede mapear
+        return False
+
+
+# Marcas de un servicio, de la menos a la más frecuente: en los archivos
+# que no son servicios all() se corta tras una sola búsqueda
+_SERVICE_MARKERS = (b"TabulaCloudService", b"def perform_sync")
+
+
+def _is_service_file(path: str) -> bool:
+    """Indica si el archivo define un servicio de Tabula Cloud."""
+    return _file_contains(path, _SERVICE_MARKERS)
+
+
+def find_tabula_services(
+    root: Path, jobs: Optional[int] = None
+) -> Tuple[Path, ...]:
+    """
+    Encuentra los servicios que usan TabulaCloudService bajo root.
+
+    Con jobs, los directorios se listan y los archivos se revisan en un
+    pool de hilos: en discos lentos o de red el recorrido está dominado
+    por la latencia de E/S. Sin jobs (o con 1) el recorrido es secuencial,
+    suficiente para los pocos archivos de un proyecto típico. Cada llamada
+    recorre el árbol de nuevo, así que refleja los servicios agregados o
+    eliminados desde la anterior.
+
+    Args:
+        root: Directorio raíz del proyecto
+        jobs: Hilos a usar (por defecto, ninguno: recorrido secuencial)
+
+    Returns:
+        Tupla con las rutas de los archivos de servicio
+    """
+    if jobs is None or jobs <= 1:
+        return tuple(
+            Path(path)
+            for path in _iter_py_files(os.fspath(root))
+            if _is_service_file(path)
+        )
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        py_files = list(_iter_py_files(os.fspath(root), executor))
+        matches = executor.map(_is_service_file, py_files)
+        return tuple(
+            Path(path) for path, is_service in zip(py_files, matches)
+            if is_service
+        )
 
 
 class ProjectDetector:
@@ -13,6 +148,8 @@ class ProjectDetector:
     def __init__(self):
         self.project_root = self._find_project_root()
         self.project_markers_file = self.project_root / ".tabula_markers"
+        self._project_type = None
+        self._database_type = _UNSET
 
     def _find_project_root(self) -> Path:
         """Encuentra la raíz del proyecto actual."""
@@ -75,18 +212,11 @@ class ProjectDetector:
 
     def _has_tabula_services(self) -> bool:
         """Verifica si el proyecto ya tiene servicios de Tabula Cloud."""
-        python_files = list(self.project_root.rglob("*.py"))
-
-        for py_file in python_files:
-            try:
-                with open(py_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    if "TabulaCloudService" in content and "class" in content:
-                        return True
-            except (UnicodeDecodeError, PermissionError):
-                continue
-
-        return False
+        markers = (b"TabulaCloudService", b"class")
+        return any(
+            _file_contains(path, markers)
+            for path in _iter_py_files(os.fspath(self.project_root))
+        )
 
     def mark_as_configured(self) -> None:
         """Marca el proyecto como configurado."""
@@ -99,7 +229,17 @@ class ProjectDetector:
         return self.project_root
 
     def get_project_type(self) -> str:
-        """Detecta el tipo de proyecto Python."""
+        """
+        Detecta el tipo de proyecto Python.
+
+        El resultado se calcula una vez por instancia.
+        """
+        if self._project_type is None:
+            self._project_type = self._detect_project_type()
+        return self._project_type
+
+    def _detect_project_type(self) -> str:
+        """Revisa los archivos característicos de cada tipo de proyecto."""
         if (self.project_root / "manage.py").exists():
             return "django"
         elif (self.project_root / "app.py").exists():
@@ -114,7 +254,17 @@ class ProjectDetector:
             return "generic"
 
     def detect_database_type(self) -> Optional[str]:
-        """Detecta el tipo de base de datos utilizada en el proyecto."""
+        """
+        Detecta el tipo de base de datos utilizada en el proyecto.
+
+        El resultado se calcula una vez por instancia.
+        """
+        if self._database_type is _UNSET:
+            self._database_type = self._scan_database_type()
+        return self._database_type
+
+    def _scan_database_type(self) -> Optional[str]:
+        """Busca drivers conocidos en los archivos de dependencias."""
         requirements_files = [
             self.project_root / "requirements.txt",
             self.project_root / "pyproject.toml",
@@ -146,20 +296,4 @@ class ProjectDetector:
 
     def get_existing_services(self) -> List[Path]:
         """Encuentra servicios existentes que usan TabulaCloudService."""
-        services = []
-        python_files = list(self.project_root.rglob("*.py"))
-
-        for py_file in python_files:
-            try:
-                with open(py_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    if (
-                        "class" in content
-                        and "TabulaCloudService" in content
-                        and "def perform_sync" in content
-                    ):
-                        services.append(py_file)
-            except (UnicodeDecodeError, PermissionError):
-                continue
-
-        return services
+        return list(find_tabula_services(self.project_root))
@@ -6,85 +6,91 @@ como servicios, modelos y daemons para proyectos nuevos.
 """
 
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-
-from ..utils.directories import ensure_directory
+from string import Template
+from typing import Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
-class TemplateGenerator:
+def _module_prologue(docstring: str, imports: str) -> str:
     """
-    Generador de templates de código para proyectos Tabula Cloud Sync.
+    Compone la cabecera común de los módulos generados.
 
-    Crea archivos base de servicios, modelos y daemons con estructura
-    predefinida y mejores prácticas incluidas.
-    """
+    Los tres templates comparten el docstring de módulo, ``import logging``
+    y la creación del ``logger``; solo varían el texto y los imports.
 
-    def __init__(self, project_root: Path):
-        """
-        Inicializa el generador de templates.
+    Args:
+        docstring: Texto del docstring del módulo generado
+        imports: Imports adicionales a ``logging``
 
-        Args:
-            project_root: Directorio raíz del proyecto
-        """
-        self.project_root = Path(project_root)
-        self.services_dir = self.project_root / "services"
-        self.models_dir = self.project_root / "models"
+    Returns:
+        Texto de la cabecera del módulo
+    """
+    return (
+        f'"""\n{docstring}\n"""\n\n'
+        f"import logging\n{imports}\n\n\n"
+        "logger = logging.getLogger(__name__)\n"
+    )
 
-    def generate_service_template(
-        self,
-        service_name: str,
-        project_name: str,
-        output_dir: Optional[Path] = None,
-    ) -> Path:
-        """
-        Genera un template de servicio base.
 
-        Args:
-            service_name: Nombre del servicio a crear
-            project_name: Nombre del proyecto
-            output_dir: Directorio de salida personalizado
+def _main_block(kind: str, module: str, body: str) -> str:
+    """
+    Compone el bloque ``if __name__ == "__main__"`` de los módulos generados.
 
-        Returns:
-            Path al archivo generado
-        """
-        output_dir = output_dir or self.services_dir
-        ensure_directory(output_dir)
+    Los scripts de prueba de servicio y modelo comparten la cabecera:
+    un import y la configuración básica de logging.
 
-        # Limpiar nombre del servicio
-        clean_service_name = service_name.replace("Service", "").replace(
-            "service", ""
-        )
-        service_class_name = f"{clean_service_name}Service"
-        filename = f"{clean_service_name.lower()}_service.py"
+    Args:
+        kind: Tipo de módulo para el comentario (servicio, modelo)
+        module: Módulo a importar dentro del bloque
+        body: Resto del bloque, ya indentado
 
-        template_content = f'''"""
-Servicio de sincronización para {project_name}.
+    Returns:
+        Texto del bloque principal
+    """
+    return (
+        'if __name__ == "__main__":\n'
+        f"    # Script de prueba del {kind}\n"
+        f"    import {module}\n"
+        "    \n"
+        "    # Configurar logging básico\n"
+        "    logging.basicConfig(\n"
+        "        level=logging.INFO,\n"
+        "        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'\n"
+        "    )\n"
+        "    \n"
+    ) + body
+
+
+# Fuentes de los templates de código. Usan marcadores ``$nombre`` de
+# string.Template, así que las llaves del código generado van literales.
+_SERVICE_TEMPLATE_SRC = _module_prologue(
+    '''Servicio de sincronización para ${project_name}.
 
 Este servicio maneja la sincronización de datos entre la aplicación local
-y Tabula Cloud, implementando la lógica de negocio específica del proyecto.
-"""
-
-import logging
-from typing import Any, Dict, List, Optional
+y Tabula Cloud, implementando la lógica de negocio específica del proyecto.''',
+    '''from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-from tabula_cloud_sync.service.base_service import BaseService
-
-
-logger = logging.getLogger(__name__)
-
+from tabula_cloud_sync.service.base_service import BaseService''',
+) + '''
 
-class {service_class_name}(BaseService):
+class ${service_class_name}(BaseService):
     """
-    Servicio de sincronización para {project_name}.
+    Servicio de sincronización para ${project_name}.
     
     Implementa la lógica específica de sincronización de datos
     entre la aplicación local y Tabula Cloud.
     """
     
+    # TODO: Definir campos requeridos
+    _REQUIRED_FIELDS = frozenset({'id'})
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Inicializa el servicio de sincronización.
@@ -95,7 +101,7 @@ class {service_class_name}(BaseService):
         # Usar config_path o valor por defecto
         config_file = config_path or "config.ini"
         super().__init__(config_file)
-        self.service_name = "{clean_service_name}"
+        self.service_name = "${clean_service_name}"
         
     def process_sync_data(self, data: List[Dict[str, Any]]) -> bool:
         """
@@ -108,25 +114,30 @@ class {service_class_name}(BaseService):
             bool: True si el procesamiento fue exitoso
         """
         try:
-            logger.info(f"Procesando {{len(data)}} registros para sincronización")
+            logger.info("Procesando %s registros para sincronización", len(data))
             
+            # Un único timestamp para todo el lote
+            timestamp = datetime.now().isoformat()
             for record in data:
                 # TODO: Implementar lógica específica de procesamiento
-                self._process_single_record(record)
+                self._process_single_record(record, timestamp)
                 
             logger.info("Procesamiento completado exitosamente")
             return True
             
         except Exception as e:
-            logger.error(f"Error procesando datos: {{e}}")
+            logger.error("Error procesando datos: %s", e)
             return False
     
-    def _process_single_record(self, record: Dict[str, Any]) -> None:
+    def _process_single_record(
+        self, record: Dict[str, Any], timestamp: Optional[str] = None
+    ) -> None:
         """
         Procesa un registro individual.
         
         Args:
             record: Datos del registro a procesar
+            timestamp: Timestamp ISO del lote en curso
         """
         # TODO: Implementar lógica específica por registro
         # Ejemplo de procesamiento básico:
@@ -134,11 +145,11 @@ class {service_class_name}(BaseService):
         # 1. Validar datos
         if not self._validate_record(record):
             record_id = record.get('id', 'unknown')
-            logger.warning(f"Registro inválido ignorado: {{record_id}}")
+            logger.warning("Registro inválido ignorado: %s", record_id)
             return
             
         # 2. Transformar datos si es necesario
-        transformed_data = self._transform_record(record)
+        transformed_data = self._transform_record(record, timestamp)
         
         # 3. Preparar para envío a Tabula Cloud
         self._prepare_for_sync(transformed_data)
@@ -154,20 +165,21 @@ class {service_class_name}(BaseService):
             bool: True si el registro es válido
         """
         # TODO: Implementar validaciones específicas
-        required_fields = ['id']  # Definir campos requeridos
-        
-        for field in required_fields:
-            if field not in record or record[field] is None:
+        for field in self._REQUIRED_FIELDS:
+            if record.get(field) is None:
                 return False
                 
         return True
     
-    def _transform_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def _transform_record(
+        self, record: Dict[str, Any], timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Transforma un registro al formato requerido.
         
         Args:
             record: Datos originales del registro
+            timestamp: Timestamp ISO del lote; si falta se usa la hora actual
             
         Returns:
             Dict con datos transformados
@@ -177,7 +189,7 @@ class {service_class_name}(BaseService):
         
         # Ejemplo de transformaciones comunes:
         if 'timestamp' not in transformed:
-            transformed['timestamp'] = datetime.now().isoformat()
+            transformed['timestamp'] = timestamp or datetime.now().isoformat()
             
         return transformed
     
@@ -194,7 +206,7 @@ class {service_class_name}(BaseService):
         # - Marcar como pendiente en base de datos local
         # - Aplicar reglas de negocio específicas
         
-        logger.debug(f"Registro preparado para sync: {{record.get('id')}}")
+        logger.debug("Registro preparado para sync: %s", record.get('id'))
     
     def get_pending_records(self) -> List[Dict[str, Any]]:
         """
@@ -221,13 +233,35 @@ class {service_class_name}(BaseService):
         """
         try:
             # TODO: Implementar actualización en base de datos local
-            logger.info(f"Registro {{record_id}} marcado como sincronizado")
+            logger.info("Registro %s marcado como sincronizado", record_id)
             return True
             
         except Exception as e:
-            logger.error(f"Error marcando registro como sincronizado: {{e}}")
+            logger.error("Error marcando registro como sincronizado: %s", e)
             return False
     
+    def mark_batch_as_synced(self, record_ids: List[str]) -> int:
+        """
+        Marca un lote de registros como sincronizados.
+        
+        Pensado para una sola sentencia por lote (por ejemplo
+        UpdateQueries.mark_many_as_synced) en lugar de una por registro.
+        
+        Args:
+            record_ids: IDs de los registros sincronizados
+            
+        Returns:
+            int: Cantidad de registros marcados
+        """
+        try:
+            # TODO: Implementar actualización en lote en base de datos local
+            logger.info("%s registros marcados como sincronizados", len(record_ids))
+            return len(record_ids)
+            
+        except Exception as e:
+            logger.error("Error marcando lote como sincronizado: %s", e)
+            return 0
+    
     def get_service_status(self) -> Dict[str, Any]:
         """
         Obtiene el estado actual del servicio.
@@ -237,13 +271,13 @@ class {service_class_name}(BaseService):
         """
         pending_count = len(self.get_pending_records())
         
-        return {{
+        return {
             'service_name': self.service_name,
             'status': 'running' if self.running else 'stopped',
             'pending_records': pending_count,
             'last_sync': self.last_sync_time.isoformat() if self.last_sync_time else None,
             'config_valid': self.config is not None
-        }}
+        }
     
     def perform_sync(self) -> Dict[str, Any]:
         """
@@ -255,22 +289,23 @@ class {service_class_name}(BaseService):
         Returns:
             Dict con resultados de la sincronización
         """
+        now = datetime.now().isoformat()
         try:
-            logger.info(f"Iniciando sincronización para {{self.service_name}}")
+            logger.info("Iniciando sincronización para ${clean_service_name}")
             
             # 1. Obtener registros pendientes de sincronización
             pending_records = self.get_pending_records()
             
             if not pending_records:
                 logger.info("No hay registros pendientes para sincronizar")
-                return {{
+                return {
                     'status': 'success',
                     'message': 'No hay datos pendientes',
                     'records_processed': 0,
-                    'timestamp': datetime.now().isoformat()
-                }}
+                    'timestamp': now
+                }
             
-            logger.info(f"Encontrados {{len(pending_records)}} registros pendientes")
+            logger.info("Encontrados %s registros pendientes", len(pending_records))
             
             # 2. Procesar registros para sincronización
             if not self.process_sync_data(pending_records):
@@ -279,35 +314,33 @@ class {service_class_name}(BaseService):
             # 3. Enviar datos a Tabula Cloud
             sync_result = self._send_to_tabula_cloud(pending_records)
             
-            # 4. Marcar registros como sincronizados
-            synced_count = 0
-            for record in pending_records:
-                record_id = record.get('id', 'unknown')
-                if self.mark_as_synced(record_id):
-                    synced_count += 1
+            # 4. Marcar registros como sincronizados en un solo lote
+            synced_count = self.mark_batch_as_synced(
+                [record.get('id', 'unknown') for record in pending_records]
+            )
             
             total_records = len(pending_records)
             logger.info(
-                f"Sync completado: {{synced_count}}/{{total_records}} registros"
+                "Sync completado: %s/%s registros", synced_count, total_records
             )
             
-            return {{
+            return {
                 'status': 'success',
                 'message': f'Sincronización completada exitosamente',
-                'records_processed': len(pending_records),
+                'records_processed': total_records,
                 'records_synced': synced_count,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now,
                 'sync_details': sync_result
-            }}
+            }
             
         except Exception as e:
-            logger.error(f"Error en sincronización: {{e}}")
-            return {{
+            logger.error("Error en sincronización: %s", e)
+            return {
                 'status': 'error',
-                'message': f'Error en sincronización: {{str(e)}}',
+                'message': f'Error en sincronización: {str(e)}',
                 'records_processed': 0,
-                'timestamp': datetime.now().isoformat()
-            }}
+                'timestamp': now
+            }
     
     def _send_to_tabula_cloud(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -323,20 +356,20 @@ class {service_class_name}(BaseService):
             if not self.session:
                 raise Exception("Sesión no inicializada")
             
-            logger.info(f"Enviando {{len(records)}} registros a Tabula Cloud")
+            logger.info("Enviando %s registros a Tabula Cloud", len(records))
             
             # TODO: Implementar lógica específica de envío según la API de Tabula Cloud
             # Ejemplo de estructura básica:
             
-            payload = {{
+            payload = {
                 'service_name': self.service_name,
                 'timestamp': datetime.now().isoformat(),
                 'data': records,
-                'metadata': {{
+                'metadata': {
                     'count': len(records),
                     'source': 'sync_service'
-                }}
-            }}
+                }
+            }
             
             # Simular envío exitoso (reemplazar con llamada real a la API)
             # response = self.session.post('/api/sync', json=payload)
@@ -344,19 +377,19 @@ class {service_class_name}(BaseService):
             
             logger.info("Datos enviados exitosamente a Tabula Cloud")
             
-            return {{
+            return {
                 'sent_records': len(records),
                 'api_response': 'success',  # response.json() en implementación real
                 'endpoint': '/api/sync'
-            }}
+            }
             
         except Exception as e:
-            logger.error(f"Error enviando datos a Tabula Cloud: {{e}}")
+            logger.error("Error enviando datos a Tabula Cloud: %s", e)
             raise
 
 
 # Función de conveniencia para crear instancia del servicio
-def create_service(config_path: Optional[str] = None) -> {service_class_name}:
+def create_service(config_path: Optional[str] = None) -> ${service_class_name}:
     """
     Crea una instancia del servicio de sincronización.
     
@@ -366,31 +399,24 @@ def create_service(config_path: Optional[str] = None) -> {service_class_name}:
     Returns:
         Instancia del servicio configurada
     """
-    return {service_class_name}(config_path)
+    return ${service_class_name}(config_path)
 
 
-if __name__ == "__main__":
-    # Script de prueba del servicio
-    import sys
-    
-    # Configurar logging básico
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    
-    try:
+''' + _main_block(
+    "servicio",
+    "sys",
+    '''    try:
         # Crear servicio
         service = create_service()
         
         # Mostrar estado
         status = service.get_service_status()
-        print(f"Estado del servicio: {{status}}")
+        print(f"Estado del servicio: {status}")
         
         # Datos de prueba
         test_data = [
-            {{'id': '1', 'name': 'Test Record 1', 'value': 100}},
-            {{'id': '2', 'name': 'Test Record 2', 'value': 200}}
+            {'id': '1', 'name': 'Test Record 1', 'value': 100},
+            {'id': '2', 'name': 'Test Record 2', 'value': 200}
         ]
         
         # Procesar datos de prueba
@@ -400,62 +426,39 @@ if __name__ == "__main__":
             print("❌ Error en procesamiento de prueba")
             
     except Exception as e:
-        print(f"❌ Error ejecutando servicio: {{e}}")
+        print(f"❌ Error ejecutando servicio: {e}")
         sys.exit(1)
-'''
-
-        output_file = output_dir / filename
-        output_file.write_text(template_content)
-
-        logger.info(f"Template de servicio generado: {output_file}")
-        return output_file
-
-    def generate_model_template(
-        self, model_name: str, output_dir: Optional[Path] = None
-    ) -> Path:
-        """
-        Genera un template de modelo base.
-
-        Args:
-            model_name: Nombre del modelo a crear
-            output_dir: Directorio de salida personalizado
+''',
+)
 
-        Returns:
-            Path al archivo generado
-        """
-        output_dir = output_dir or self.models_dir
-        ensure_directory(output_dir)
-
-        # Limpiar nombre del modelo
-        clean_model_name = model_name.replace("Model", "").replace("model", "")
-        model_class_name = f"{clean_model_name}Model"
-        filename = f"{clean_model_name.lower()}_model.py"
 
-        template_content = f'''"""
-Modelo de datos para {clean_model_name}.
+_MODEL_TEMPLATE_SRC = _module_prologue(
+    '''Modelo de datos para ${clean_model_name}.
 
-Define la estructura y comportamiento de los datos {clean_model_name}
-para sincronización con Tabula Cloud.
-"""
-
-import logging
-from datetime import datetime
+Define la estructura y comportamiento de los datos ${clean_model_name}
+para sincronización con Tabula Cloud.''',
+    '''from datetime import datetime
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass, field
 
 from tabula_cloud_sync.models.base_model import BaseModel
 
-
-logger = logging.getLogger(__name__)
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = datetime.fromisoformat''',
+) + '''
+# Campos simples enviados tal cual a Tabula Cloud
+_SYNC_FIELDS = ('id', 'name', 'description')
 
 
 @dataclass
-class {model_class_name}(BaseModel):
+class ${model_class_name}(BaseModel):
     """
-    Modelo de datos para {clean_model_name}.
+    Modelo de datos para ${clean_model_name}.
     
     Representa la estructura de datos que se sincronizará
-    con Tabula Cloud para entidades {clean_model_name}.
+    con Tabula Cloud para entidades ${clean_model_name}.
     """
     
     # Campos básicos (personalizar según necesidades)
@@ -503,7 +506,7 @@ class {model_class_name}(BaseModel):
         # TODO: Agregar más validaciones específicas
         
         if errors:
-            error_msg = f"Errores de validación en {{self.__class__.__name__}}: {{', '.join(errors)}}"
+            error_msg = f"Errores de validación en {self.__class__.__name__}: {', '.join(errors)}"
             logger.error(error_msg)
             raise ValueError(error_msg)
             
@@ -516,23 +519,26 @@ class {model_class_name}(BaseModel):
         Returns:
             Dict con datos en formato de sincronización
         """
-        # Formato base para Tabula Cloud
-        sync_data = {{
-            'id': self.id,
-            'name': self.name,
-            'description': self.description,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'metadata': self.metadata
-        }}
+        # Formato base para Tabula Cloud, omitiendo valores None en una
+        # sola pasada
+        sync_data = {}
+        for name in _SYNC_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                sync_data[name] = value
+        if self.created_at:
+            sync_data['created_at'] = self.created_at.isoformat()
+        if self.updated_at:
+            sync_data['updated_at'] = self.updated_at.isoformat()
+        if self.metadata is not None:
+            sync_data['metadata'] = self.metadata
         
         # TODO: Personalizar formato según requirements de Tabula Cloud
         
-        # Filtrar valores None
-        return {{k: v for k, v in sync_data.items() if v is not None}}
+        return sync_data
     
     @classmethod
-    def from_sync_data(cls, data: Dict[str, Any]) -> '{model_class_name}':
+    def from_sync_data(cls, data: Dict[str, Any]) -> '${model_class_name}':
         """
         Crea una instancia del modelo desde datos de sincronización.
         
@@ -548,15 +554,15 @@ class {model_class_name}(BaseModel):
         
         if 'created_at' in data and data['created_at']:
             try:
-                created_at = datetime.fromisoformat(data['created_at'])
+                created_at = _parse_datetime(data['created_at'])
             except ValueError:
-                logger.warning(f"Formato de fecha inválido para created_at: {{data['created_at']}}")
+                logger.warning("Formato de fecha inválido para created_at: %s", data['created_at'])
                 
         if 'updated_at' in data and data['updated_at']:
             try:
-                updated_at = datetime.fromisoformat(data['updated_at'])
+                updated_at = _parse_datetime(data['updated_at'])
             except ValueError:
-                logger.warning(f"Formato de fecha inválido para updated_at: {{data['updated_at']}}")
+                logger.warning("Formato de fecha inválido para updated_at: %s", data['updated_at'])
         
         return cls(
             id=data.get('id'),
@@ -564,7 +570,7 @@ class {model_class_name}(BaseModel):
             description=data.get('description'),
             created_at=created_at,
             updated_at=updated_at,
-            metadata=data.get('metadata', {{}})
+            metadata=data.get('metadata', {})
         )
     
     def mark_as_synced(self) -> None:
@@ -581,7 +587,7 @@ class {model_class_name}(BaseModel):
             error: Descripción del error
         """
         self.sync_status = "failed"
-        self.sync_errors.append(f"{{datetime.now().isoformat()}}: {{error}}")
+        self.sync_errors.append(f"{datetime.now().isoformat()}: {error}")
         self.updated_at = datetime.now()
         
     def is_sync_pending(self) -> bool:
@@ -600,19 +606,19 @@ class {model_class_name}(BaseModel):
         Returns:
             Dict con información de sincronización
         """
-        return {{
+        return {
             'id': self.id,
             'name': self.name,
             'sync_status': self.sync_status,
             'last_updated': self.updated_at.isoformat() if self.updated_at else None,
             'error_count': len(self.sync_errors),
             'last_error': self.sync_errors[-1] if self.sync_errors else None
-        }}
+        }
 
 
-class {model_class_name}Repository:
+class ${model_class_name}Repository:
     """
-    Repositorio para manejar operaciones de datos del modelo {model_class_name}.
+    Repositorio para manejar operaciones de datos del modelo ${model_class_name}.
     
     Proporciona métodos para CRUD y operaciones de sincronización.
     """
@@ -626,7 +632,7 @@ class {model_class_name}Repository:
         """
         self.db = db_connection
         
-    def save(self, model: {model_class_name}) -> bool:
+    def save(self, model: ${model_class_name}) -> bool:
         """
         Guarda un modelo en la base de datos.
         
@@ -638,7 +644,7 @@ class {model_class_name}Repository:
         """
         try:
             # TODO: Implementar persistencia en base de datos
-            logger.info(f"Guardando modelo {{model.id}}")
+            logger.info("Guardando modelo %s", model.id)
             
             # Validar antes de guardar
             model.validate()
@@ -651,10 +657,10 @@ class {model_class_name}Repository:
             return True
             
         except Exception as e:
-            logger.error(f"Error guardando modelo: {{e}}")
+            logger.error("Error guardando modelo: %s", e)
             return False
     
-    def find_by_id(self, model_id: str) -> Optional[{model_class_name}]:
+    def find_by_id(self, model_id: str) -> Optional[${model_class_name}]:
         """
         Busca un modelo por ID.
         
@@ -666,16 +672,16 @@ class {model_class_name}Repository:
         """
         try:
             # TODO: Implementar consulta a base de datos
-            logger.info(f"Buscando modelo con ID: {{model_id}}")
+            logger.info("Buscando modelo con ID: %s", model_id)
             
             # Placeholder - implementar consulta real
             return None
             
         except Exception as e:
-            logger.error(f"Error buscando modelo: {{e}}")
+            logger.error("Error buscando modelo: %s", e)
             return None
     
-    def find_pending_sync(self) -> List[{model_class_name}]:
+    def find_pending_sync(self) -> List[${model_class_name}]:
         """
         Obtiene todos los modelos pendientes de sincronización.
         
@@ -690,7 +696,7 @@ class {model_class_name}Repository:
             return []
             
         except Exception as e:
-            logger.error(f"Error obteniendo modelos pendientes: {{e}}")
+            logger.error("Error obteniendo modelos pendientes: %s", e)
             return []
     
     def delete(self, model_id: str) -> bool:
@@ -705,17 +711,17 @@ class {model_class_name}Repository:
         """
         try:
             # TODO: Implementar eliminación en base de datos
-            logger.info(f"Eliminando modelo {{model_id}}")
+            logger.info("Eliminando modelo %s", model_id)
             
             return True
             
         except Exception as e:
-            logger.error(f"Error eliminando modelo: {{e}}")
+            logger.error("Error eliminando modelo: %s", e)
             return False
 
 
 # Funciones de conveniencia
-def create_model(data: Dict[str, Any]) -> {model_class_name}:
+def create_model(data: Dict[str, Any]) -> ${model_class_name}:
     """
     Crea una instancia del modelo desde datos.
     
@@ -725,10 +731,10 @@ def create_model(data: Dict[str, Any]) -> {model_class_name}:
     Returns:
         Instancia del modelo
     """
-    return {model_class_name}.from_sync_data(data)
+    return ${model_class_name}.from_sync_data(data)
 
 
-def create_repository(db_connection=None) -> {model_class_name}Repository:
+def create_repository(db_connection=None) -> ${model_class_name}Repository:
     """
     Crea una instancia del repositorio.
     
@@ -738,34 +744,27 @@ def create_repository(db_connection=None) -> {model_class_name}Repository:
     Returns:
         Instancia del repositorio
     """
-    return {model_class_name}Repository(db_connection)
+    return ${model_class_name}Repository(db_connection)
 
 
-if __name__ == "__main__":
-    # Script de prueba del modelo
-    import json
-    
-    # Configurar logging básico
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    
-    try:
+''' + _main_block(
+    "modelo",
+    "json",
+    '''    try:
         # Crear modelo de prueba
-        test_data = {{
+        test_data = {
             'id': 'test-001',
             'name': 'Modelo de Prueba',
             'description': 'Este es un modelo de prueba',
-            'metadata': {{'test': True, 'version': '1.0'}}
-        }}
+            'metadata': {'test': True, 'version': '1.0'}
+        }
         
         model = create_model(test_data)
-        print(f"✅ Modelo creado: {{model.name}}")
+        print(f"✅ Modelo creado: {model.name}")
         
         # Probar conversión a formato de sync
         sync_format = model.to_sync_format()
-        print(f"📤 Formato de sync: {{json.dumps(sync_format, indent=2)}}")
+        print(f"📤 Formato de sync: {json.dumps(sync_format, indent=2)}")
         
         # Probar validación
         model.validate()
@@ -773,67 +772,41 @@ if __name__ == "__main__":
         
         # Probar estados de sync
         model.mark_as_synced()
-        print(f"📊 Estado después de sync: {{model.get_sync_summary()}}")
+        print(f"📊 Estado después de sync: {model.get_sync_summary()}")
         
     except Exception as e:
-        print(f"❌ Error en prueba del modelo: {{e}}")
+        print(f"❌ Error en prueba del modelo: {e}")
         import traceback
         traceback.print_exc()
-'''
-
-        output_file = output_dir / filename
-        output_file.write_text(template_content)
-
-        logger.info(f"Template de modelo generado: {output_file}")
-        return output_file
-
-    def generate_daemon_template(
-        self, service_name: str, output_dir: Optional[Path] = None
-    ) -> Path:
-        """
-        Genera un template de daemon base.
-
-        Args:
-            service_name: Nombre del servicio para el daemon
-            output_dir: Directorio de salida personalizado
-
-        Returns:
-            Path al archivo generado
-        """
-        output_dir = output_dir or self.services_dir
-        ensure_directory(output_dir)
+''',
+)
 
-        # Limpiar nombre del servicio
-        clean_service_name = service_name.replace("Service", "").replace(
-            "service", ""
-        )
-        daemon_class_name = f"{clean_service_name}Daemon"
-        filename = f"{clean_service_name.lower()}_daemon.py"
 
-        template_content = f'''"""
-Daemon de sincronización para {clean_service_name}.
+_DAEMON_TEMPLATE_SRC = _module_prologue(
+    '''Daemon de sincronización para ${clean_service_name}.
 
 Ejecuta el servicio de sincronización como un proceso daemon,
-manejando el ciclo de vida del servicio y la sincronización automática.
-"""
-
-import logging
+manejando el ciclo de vida del servicio y la sincronización automática.''',
+    '''import os
+import selectors
 import signal
 import sys
 import time
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from threading import Event, Thread
+from typing import Dict, List, Optional
+from threading import Event, Lock, Thread, local
 
-from tabula_cloud_sync.service.daemon import BaseDaemon
+from tabula_cloud_sync.service.daemon import BaseDaemon''',
+) + '''
+# Instancias vivas, para reiniciar su estado de hilos en procesos hijos
+_daemons = weakref.WeakSet()
 
 
-logger = logging.getLogger(__name__)
-
-
-class {daemon_class_name}(BaseDaemon):
+class ${daemon_class_name}(BaseDaemon):
     """
-    Daemon para ejecutar el servicio de sincronización {clean_service_name}.
+    Daemon para ejecutar el servicio de sincronización ${clean_service_name}.
     
     Maneja la ejecución continua del servicio, incluyendo:
     - Inicio/parada del servicio
@@ -846,7 +819,8 @@ class {daemon_class_name}(BaseDaemon):
         self, 
         config_path: Optional[str] = None,
         sync_interval: int = 60,
-        max_retries: int = 3
+        max_retries: int = 3,
+        shutdown_timeout: Optional[float] = 30
     ):
         """
         Inicializa el daemon.
@@ -855,25 +829,49 @@ class {daemon_class_name}(BaseDaemon):
             config_path: Ruta al archivo de configuración
             sync_interval: Intervalo de sincronización en segundos
             max_retries: Número máximo de reintentos en caso de error
+            shutdown_timeout: Segundos a esperar al hilo de sincronización
+                al detener (0 o None: esperar sin límite)
         """
         super().__init__(config_path)
         
-        self.service_name = "{clean_service_name}"
+        self.service_name = "${clean_service_name}"
         self.sync_interval = sync_interval
         self.max_retries = max_retries
+        self.shutdown_timeout = shutdown_timeout
         
-        # Control de ejecución
-        self._stop_event = Event()
+        # Control de ejecución (el evento se crea al iniciar el daemon)
+        self._stop_event: Optional[Event] = None
         self._sync_thread: Optional[Thread] = None
+        self._wakeup_fd: Optional[int] = None
         
-        # Estadísticas
-        self.sync_count = 0
-        self.error_count = 0
+        # Estadísticas: acumuladores por hilo, sumados solo en get_status
+        self._tls = local()
+        self._counters_lock = Lock()
+        self._thread_counters: List[Dict[str, int]] = []
         self.last_sync_time: Optional[float] = None
+        # Instante monótono de run_forever (0.0: no iniciado)
+        self.start_time: float = 0.0
         
         # Configurar manejo de señales
         self._setup_signal_handlers()
         
+        _daemons.add(self)
+        
+    def _reset_thread_state(self) -> None:
+        """
+        Descarta el hilo, el evento y los contadores heredados del padre.
+        
+        Tras un fork el hijo solo conserva el hilo que llamó a fork(): el
+        hilo de sincronización copiado está muerto y el evento puede
+        quedar señalado, lo que bloquearía start()/stop() en el hijo.
+        """
+        self._sync_thread = None
+        self._stop_event = None
+        self._wakeup_fd = None
+        self._tls = local()
+        self._counters_lock = Lock()
+        self._thread_counters = []
+        
     def _setup_signal_handlers(self):
         """Configura los manejadores de señales del sistema."""
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -882,6 +880,36 @@ class {daemon_class_name}(BaseDaemon):
         if hasattr(signal, 'SIGHUP'):
             signal.signal(signal.SIGHUP, self._signal_handler)
             
+    def _bump(self, field: str) -> None:
+        """
+        Incrementa un contador en el acumulador del hilo actual.
+        
+        Args:
+            field: Nombre del contador ('sync_count' o 'error_count')
+        """
+        counters = getattr(self._tls, 'counters', None)
+        if counters is None:
+            counters = {'sync_count': 0, 'error_count': 0}
+            self._tls.counters = counters
+            with self._counters_lock:
+                self._thread_counters.append(counters)
+        counters[field] += 1
+    
+    def _total(self, field: str) -> int:
+        """Suma un contador sobre los acumuladores de todos los hilos."""
+        with self._counters_lock:
+            return sum(counters[field] for counters in self._thread_counters)
+    
+    @property
+    def sync_count(self) -> int:
+        """Total de sincronizaciones exitosas."""
+        return self._total('sync_count')
+    
+    @property
+    def error_count(self) -> int:
+        """Total de sincronizaciones con error."""
+        return self._total('error_count')
+    
     def _signal_handler(self, signum, frame):
         """
         Maneja señales del sistema.
@@ -890,16 +918,16 @@ class {daemon_class_name}(BaseDaemon):
             signum: Número de la señal
             frame: Frame actual
         """
-        signal_names = {{
+        signal_names = {
             signal.SIGTERM: 'SIGTERM',
             signal.SIGINT: 'SIGINT'
-        }}
+        }
         
         if hasattr(signal, 'SIGHUP'):
             signal_names[signal.SIGHUP] = 'SIGHUP'
             
-        signal_name = signal_names.get(signum, f'Signal {{signum}}')
-        logger.info(f"Recibida señal {{signal_name}}, iniciando parada...")
+        signal_name = signal_names.get(signum, f'Signal {signum}')
+        logger.info("Recibida señal %s, iniciando parada...", signal_name)
         
         if signum == getattr(signal, 'SIGHUP', None):
             # SIGHUP - recargar configuración
@@ -915,8 +943,12 @@ class {daemon_class_name}(BaseDaemon):
         Returns:
             bool: True si se inició exitosamente
         """
+        if self._sync_thread is not None and self._sync_thread.is_alive():
+            logger.warning("El daemon ${clean_service_name} ya está en ejecución")
+            return True
+        
         try:
-            logger.info(f"Iniciando daemon {{self.service_name}}...")
+            logger.info("Iniciando daemon ${clean_service_name}...")
             
             # Verificar configuración
             if not self.config:
@@ -929,29 +961,37 @@ class {daemon_class_name}(BaseDaemon):
                 return False
             
             # Iniciar hilo de sincronización
+            self._stop_event = Event()
             self._sync_thread = Thread(target=self._sync_loop, daemon=True)
             self._sync_thread.start()
             
-            logger.info(f"Daemon {{self.service_name}} iniciado exitosamente")
-            logger.info(f"Intervalo de sincronización: {{self.sync_interval}} segundos")
+            logger.info("Daemon ${clean_service_name} iniciado exitosamente")
+            logger.info("Intervalo de sincronización: %s segundos", self.sync_interval)
             
             return True
             
         except Exception as e:
-            logger.error(f"Error iniciando daemon: {{e}}")
+            logger.error("Error iniciando daemon: %s", e)
             return False
     
     def stop(self) -> None:
         """Detiene el daemon de sincronización."""
-        logger.info(f"Deteniendo daemon {{self.service_name}}...")
+        logger.info("Deteniendo daemon ${clean_service_name}...")
         
-        # Señalar parada
-        self._stop_event.set()
+        # Señalar parada y despertar el bucle principal de run_forever
+        if self._stop_event is not None:
+            self._stop_event.set()
+        wakeup_fd = self._wakeup_fd
+        if wakeup_fd is not None:
+            try:
+                os.write(wakeup_fd, b'\\0')
+            except OSError:
+                pass
         
         # Esperar a que termine el hilo de sincronización
         if self._sync_thread and self._sync_thread.is_alive():
             logger.info("Esperando que termine la sincronización...")
-            self._sync_thread.join(timeout=30)
+            self._sync_thread.join(timeout=self.shutdown_timeout or None)
             
             if self._sync_thread.is_alive():
                 logger.warning("El hilo de sincronización no terminó en tiempo esperado")
@@ -959,7 +999,7 @@ class {daemon_class_name}(BaseDaemon):
         # Limpiar recursos
         self._cleanup_resources()
         
-        logger.info(f"Daemon {{self.service_name}} detenido")
+        logger.info("Daemon ${clean_service_name} detenido")
     
     def _initialize_service(self) -> bool:
         """
@@ -970,48 +1010,68 @@ class {daemon_class_name}(BaseDaemon):
         """
         try:
             # TODO: Importar e inicializar el servicio específico
-            # from .{clean_service_name.lower()}_service import create_service
+            # from .${service_module} import create_service
             # self.service = create_service(self.config_path)
             
             logger.info("Servicio inicializado exitosamente")
             return True
             
         except Exception as e:
-            logger.error(f"Error inicializando servicio: {{e}}")
+            logger.error("Error inicializando servicio: %s", e)
             return False
     
     def _sync_loop(self) -> None:
         """Bucle principal de sincronización."""
-        logger.info("Iniciando bucle de sincronización...")
-        
-        while not self._stop_event.is_set():
+        # Métodos del logger como locales: evita resolverlos en cada ciclo
+        info = logger.info
+        debug = logger.debug
+        warning = logger.warning
+        error = logger.error
+        # Evento de esta ejecución: un start() posterior crea uno nuevo.
+        # Sus métodos y los del daemon se resuelven una sola vez
+        is_set = self._stop_event.is_set
+        wait = self._stop_event.wait
+        perform_sync = self._perform_sync
+        bump = self._bump
+        monotonic = time.monotonic
+        # Número de sincronización para los logs, llevado en una local:
+        # sync_count toma el lock y suma los contadores de todos los hilos
+        synced = self.sync_count
+        
+        info("Iniciando bucle de sincronización...")
+        
+        while not is_set():
             try:
-                start_time = time.time()
+                # Reloj monótono: el intervalo no se altera con ajustes de hora
+                deadline = monotonic() + self.sync_interval
                 
                 # Ejecutar sincronización
-                if self._perform_sync():
-                    self.sync_count += 1
-                    self.last_sync_time = start_time
-                    logger.debug(f"Sincronización {{self.sync_count}} completada")
+                if perform_sync():
+                    bump('sync_count')
+                    synced += 1
+                    self.last_sync_time = time.time()
+                    debug("Sincronización %s completada", synced)
+                elif is_set():
+                    # Interrumpida por stop(): no cuenta como error
+                    break
                 else:
-                    self.error_count += 1
-                    logger.warning(f"Error en sincronización {{self.sync_count + 1}}")
+                    bump('error_count')
+                    warning("Error en sincronización %s", synced + 1)
                 
                 # Esperar hasta el próximo ciclo
-                elapsed = time.time() - start_time
-                wait_time = max(0, self.sync_interval - elapsed)
+                wait_time = deadline - monotonic()
                 
                 if wait_time > 0:
-                    self._stop_event.wait(wait_time)
+                    wait(wait_time)
                     
             except Exception as e:
-                self.error_count += 1
-                logger.error(f"Error inesperado en bucle de sincronización: {{e}}")
+                bump('error_count')
+                error("Error inesperado en bucle de sincronización: %s", e)
                 
                 # Esperar antes de reintentar
-                self._stop_event.wait(min(self.sync_interval, 30))
+                wait(min(self.sync_interval, 30))
         
-        logger.info("Bucle de sincronización terminado")
+        info("Bucle de sincronización terminado")
     
     def _perform_sync(self) -> bool:
         """
@@ -1020,6 +1080,9 @@ class {daemon_class_name}(BaseDaemon):
         Returns:
             bool: True si la sincronización fue exitosa
         """
+        debug = logger.debug
+        error = logger.error
+        
         try:
             # TODO: Implementar lógica de sincronización específica
             # Ejemplo de estructura:
@@ -1032,14 +1095,16 @@ class {daemon_class_name}(BaseDaemon):
             #     success = self.service.process_sync_data(pending_data)
             #     return success
             
-            # Placeholder - simular sincronización exitosa
-            logger.debug("Ejecutando sincronización...")
-            time.sleep(0.1)  # Simular trabajo
+            # Placeholder - simular sincronización exitosa. La espera
+            # respeta stop() para no retrasar la parada del daemon
+            debug("Ejecutando sincronización...")
+            if self._stop_event.wait(0.1):  # Simular trabajo
+                return False
             
             return True
             
         except Exception as e:
-            logger.error(f"Error en sincronización: {{e}}")
+            error("Error en sincronización: %s", e)
             return False
     
     def _reload_config(self) -> None:
@@ -1053,7 +1118,7 @@ class {daemon_class_name}(BaseDaemon):
             logger.info("Configuración recargada exitosamente")
             
         except Exception as e:
-            logger.error(f"Error recargando configuración: {{e}}")
+            logger.error("Error recargando configuración: %s", e)
     
     def _cleanup_resources(self) -> None:
         """Limpia recursos utilizados por el daemon."""
@@ -1062,7 +1127,48 @@ class {daemon_class_name}(BaseDaemon):
             pass
             
         except Exception as e:
-            logger.error(f"Error limpiando recursos: {{e}}")
+            logger.error("Error limpiando recursos: %s", e)
+    
+    def _wait_for_stop(self) -> bool:
+        """
+        Bloquea el hilo principal hasta que se pida la parada (POSIX).
+        
+        Las señales (vía signal.set_wakeup_fd) y stop() escriben en un
+        self-pipe vigilado por un selector, así que el hilo solo despierta
+        cuando hay algo que atender.
+        
+        Returns:
+            bool: False si no se puede usar (no es el hilo principal)
+        """
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        
+        try:
+            previous_fd = signal.set_wakeup_fd(write_fd)
+        except ValueError:
+            # set_wakeup_fd solo está permitido en el hilo principal
+            os.close(read_fd)
+            os.close(write_fd)
+            return False
+        
+        self._wakeup_fd = write_fd
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(read_fd, selectors.EVENT_READ)
+                while not self._stop_event.is_set():
+                    selector.select()
+                    try:
+                        os.read(read_fd, 512)
+                    except BlockingIOError:
+                        pass
+        finally:
+            self._wakeup_fd = None
+            signal.set_wakeup_fd(previous_fd)
+            os.close(read_fd)
+            os.close(write_fd)
+        
+        return True
     
     def get_status(self) -> dict:
         """
@@ -1071,27 +1177,31 @@ class {daemon_class_name}(BaseDaemon):
         Returns:
             Dict con información de estado
         """
-        is_running = self._sync_thread and self._sync_thread.is_alive()
+        is_running = (
+            self._sync_thread is not None and self._sync_thread.is_alive()
+        )
         
-        return {{
+        return {
             'service_name': self.service_name,
             'is_running': is_running,
             'sync_interval': self.sync_interval,
             'sync_count': self.sync_count,
             'error_count': self.error_count,
             'last_sync_time': self.last_sync_time,
-            'uptime': time.time() - self.start_time if hasattr(self, 'start_time') else 0
-        }}
+            'uptime': time.monotonic() - self.start_time if self.start_time else 0
+        }
     
     def run_forever(self) -> None:
         """
         Ejecuta el daemon indefinidamente hasta recibir señal de parada.
         
-        Método principal para ejecutar como servicio del sistema.
+        Método principal para ejecutar como servicio del sistema. En POSIX
+        el hilo principal queda bloqueado en un selector hasta que llega
+        una señal o se llama a stop(), sin despertares periódicos.
         """
         try:
             # Marcar tiempo de inicio
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
             
             # Iniciar daemon
             if not self.start():
@@ -1102,8 +1212,9 @@ class {daemon_class_name}(BaseDaemon):
             logger.info("Daemon ejecutándose... (Ctrl+C para detener)")
             
             try:
-                while not self._stop_event.is_set():
-                    self._stop_event.wait(1)
+                if os.name != 'posix' or not self._wait_for_stop():
+                    while not self._stop_event.is_set():
+                        self._stop_event.wait(1)
                     
             except KeyboardInterrupt:
                 logger.info("Interrupción por teclado recibida")
@@ -1112,27 +1223,60 @@ class {daemon_class_name}(BaseDaemon):
             self.stop()
             
         except Exception as e:
-            logger.error(f"Error ejecutando daemon: {{e}}")
+            logger.error("Error ejecutando daemon: %s", e)
             sys.exit(1)
 
 
 def create_daemon(
     config_path: Optional[str] = None,
     sync_interval: int = 60,
-    max_retries: int = 3
-) -> {daemon_class_name}:
+    max_retries: int = 3,
+    shutdown_timeout: Optional[float] = 30
+) -> ${daemon_class_name}:
     """
-    Crea una instancia del daemon.
+    Obtiene la instancia del daemon para una configuración.
+    
+    Las llamadas con la misma configuración devuelven la misma instancia,
+    así que cualquier cambio sobre ella es compartido. Para una instancia
+    independiente, instanciar ${daemon_class_name} directamente.
     
     Args:
         config_path: Ruta al archivo de configuración
         sync_interval: Intervalo de sincronización en segundos
         max_retries: Número máximo de reintentos
+        shutdown_timeout: Segundos de espera al detener (0: sin límite)
         
     Returns:
         Instancia del daemon configurada
     """
-    return {daemon_class_name}(config_path, sync_interval, max_retries)
+    if config_path is not None:
+        config_path = os.path.abspath(config_path)
+    return _cached_daemon(
+        config_path, sync_interval, max_retries, shutdown_timeout
+    )
+
+
+@lru_cache(maxsize=8)
+def _cached_daemon(
+    config_path: Optional[str],
+    sync_interval: int,
+    max_retries: int,
+    shutdown_timeout: Optional[float]
+) -> ${daemon_class_name}:
+    """Crea y memoriza una instancia del daemon por configuración."""
+    return ${daemon_class_name}(
+        config_path, sync_interval, max_retries, shutdown_timeout
+    )
+
+
+def _after_fork_child() -> None:
+    """Reinicia el estado de hilos de cada daemon en el proceso hijo."""
+    for daemon in list(_daemons):
+        daemon._reset_thread_state()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_child)
 
 
 def main():
@@ -1140,7 +1284,7 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(
-        description=f'Daemon de sincronización {clean_service_name}'
+        description=f'Daemon de sincronización ${clean_service_name}'
     )
     parser.add_argument(
         '--config', 
@@ -1153,6 +1297,12 @@ def main():
         help='Intervalo de sincronización en segundos',
         default=60
     )
+    parser.add_argument(
+        '--shutdown-timeout',
+        type=float,
+        help='Segundos a esperar la sincronización en curso al detener (0: sin límite)',
+        default=30
+    )
     parser.add_argument(
         '--log-level',
         choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
@@ -1162,20 +1312,22 @@ def main():
     
     args = parser.parse_args()
     
-    # Configurar logging
-    logging.basicConfig(
-        level=getattr(logging, args.log_level),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            # TODO: Agregar handler para archivo de log
-        ]
-    )
+    # Configurar logging solo si la aplicación anfitriona no lo hizo ya
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=getattr(logging, args.log_level),
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.StreamHandler(sys.stdout),
+                # TODO: Agregar handler para archivo de log
+            ]
+        )
     
     # Crear y ejecutar daemon
     daemon = create_daemon(
         config_path=args.config,
-        sync_interval=args.interval
+        sync_interval=args.interval,
+        shutdown_timeout=args.shutdown_timeout
     )
     
     daemon.run_forever()
@@ -1185,109 +1337,387 @@ if __name__ == "__main__":
     main()
 '''
 
-        output_file = output_dir / filename
-        output_file.write_text(template_content)
-
-        logger.info(f"Template de daemon generado: {output_file}")
-        return output_file
-
-    def generate_database_structure(
-        self, project_name: str = "Project"
-    ) -> None:
-        """
-        Genera la estructura completa de database con queries organizados.
-
-        Crea directorios y archivos base para organizar queries SQL
-        de forma limpia y mantenible, sin migraciones.
-
-        Args:
-            project_name: Nombre del proyecto para personalizar archivos
-        """
-        database_dir = self.project_root / "database"
-        queries_dir = database_dir / "queries"
-
-        # Crear directorios
-        ensure_directory(str(database_dir))
-        ensure_directory(str(queries_dir))
 
-        # Crear archivos __init__.py
-        self._create_init_files(database_dir, queries_dir)
-
-        # Crear archivos principales
-        self._create_connection_file(database_dir)
-        self._create_select_queries_file(queries_dir, project_name)
-        self._create_update_queries_file(queries_dir, project_name)
-        self._create_repository_file(database_dir, project_name)
-        self._create_custom_queries_file(queries_dir, project_name)
-
-        logger.info(f"Estructura de database creada para {project_name}")
-
-    def _create_init_files(
-        self, database_dir: Path, queries_dir: Path
-    ) -> None:
-        """Crea archivos __init__.py para los packages."""
-        database_init = (
-            '"""Database package para queries y conexiones MySQL."""\n'
-        )
-        queries_init = (
-            '"""Queries package para consultas SQL organizadas."""\n'
-        )
-
-        (database_dir / "__init__.py").write_text(database_init)
-        (queries_dir / "__init__.py").write_text(queries_init)
-
-    def _create_connection_file(self, database_dir: Path) -> None:
-        """Crea el archivo connection.py con gestor de conexiones MySQL."""
-        connection_content = '''"""
-Gestor de conexiones MySQL.
-
-Maneja conexiones seguras y eficientes a la base de datos
-con soporte para transacciones y pooling de conexiones.
-"""
-
-import logging
-import mysql.connector
-from mysql.connector import Error, pooling
-from contextlib import contextmanager
-from typing import Dict, Any, List, Optional, Tuple
-import configparser
-
-logger = logging.getLogger(__name__)
+_ASYNC_DAEMON_TEMPLATE_SRC = _module_prologue(
+    '''Daemon asíncrono de sincronización para ${clean_service_name}.
 
+Variante basada en asyncio para sincronizaciones dominadas por E/S
+(API de Tabula Cloud y base de datos): los lotes pendientes se procesan
+de forma concurrente en un único hilo, sin bloquear el bucle de eventos.''',
+    '''import asyncio
+import signal
+import sys
+import time
+from typing import Any, Dict, List, Optional''',
+) + '''
 
-class DatabaseConnection:
+class ${daemon_class_name}:
     """
-    Gestor de conexiones MySQL con pool de conexiones.
+    Daemon asíncrono para el servicio de sincronización ${clean_service_name}.
     
-    Proporciona métodos seguros para ejecutar queries SQL
-    con manejo automático de conexiones y transacciones.
+    Cada ciclo obtiene los registros pendientes agrupados en lotes y los
+    sincroniza concurrentemente, con un máximo de ``concurrency`` lotes
+    en curso a la vez.
     """
     
-    def __init__(self, config_file: str = "config/config.ini"):
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        sync_interval: int = 60,
+        concurrency: int = 4
+    ):
         """
-        Inicializa el gestor de conexiones.
+        Inicializa el daemon.
         
         Args:
-            config_file: Ruta al archivo de configuración
+            config_path: Ruta al archivo de configuración
+            sync_interval: Intervalo de sincronización en segundos
+            concurrency: Número máximo de lotes sincronizándose a la vez
         """
-        self.config_file = config_file
-        self.connection_config = self._load_config()
-        self._connection_pool = None
+        self.config_path = config_path
+        self.service_name = "${clean_service_name}"
+        self.sync_interval = sync_interval
+        self.concurrency = concurrency
         
-    def _load_config(self) -> Dict[str, Any]:
-        """Carga la configuración de MySQL desde el archivo."""
-        try:
-            config = configparser.ConfigParser()
-            config.read(self.config_file)
-            
-            if 'mysql' not in config:
-                raise ValueError("Sección [mysql] no encontrada")
-            
-            mysql_config = dict(config['mysql'])
-            
-            # Convertir puerto a entero
-            if 'port' in mysql_config:
-                mysql_config['port'] = int(mysql_config['port'])
+        # Control de ejecución (el evento se crea dentro del bucle de eventos)
+        self._stop_event: Optional[asyncio.Event] = None
+        
+        # Estadísticas
+        self.sync_count = 0
+        self.error_count = 0
+        self.last_sync_time: Optional[float] = None
+    
+    def stop(self) -> None:
+        """Solicita la parada del daemon."""
+        if self._stop_event is not None:
+            logger.info("Deteniendo daemon ${clean_service_name}...")
+            self._stop_event.set()
+    
+    async def _fetch_pending(self) -> List[List[Dict[str, Any]]]:
+        """
+        Obtiene los registros pendientes agrupados en lotes.
+        
+        Returns:
+            Lista de lotes de registros a sincronizar
+        """
+        # TODO: Obtener registros pendientes. Las llamadas bloqueantes
+        # (mysql.connector, requests) deben ir a un executor, por ejemplo:
+        # from .${service_module} import create_service
+        # loop = asyncio.get_running_loop()
+        # records = await loop.run_in_executor(
+        #     None, self.service.get_pending_records
+        # )
+        # return [records[i:i + 100] for i in range(0, len(records), 100)]
+        return []
+    
+    async def _sync_chunk(self, chunk: List[Dict[str, Any]]) -> bool:
+        """
+        Sincroniza un lote de registros con Tabula Cloud.
+        
+        Args:
+            chunk: Registros del lote
+            
+        Returns:
+            bool: True si el lote se sincronizó correctamente
+        """
+        # TODO: Enviar el lote a Tabula Cloud y marcarlo como sincronizado
+        await asyncio.sleep(0)
+        return True
+    
+    async def _perform_sync(self) -> bool:
+        """
+        Ejecuta una sincronización con los lotes en paralelo.
+        
+        Returns:
+            bool: True si todos los lotes se sincronizaron
+        """
+        chunks = await self._fetch_pending()
+        if not chunks:
+            return True
+        
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def run(chunk: List[Dict[str, Any]]) -> bool:
+            async with semaphore:
+                return await self._sync_chunk(chunk)
+        
+        results = await asyncio.gather(
+            *(run(chunk) for chunk in chunks), return_exceptions=True
+        )
+        
+        ok = True
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error sincronizando lote: %s", result)
+            if result is not True:
+                ok = False
+        return ok
+    
+    async def _sync_loop(self) -> None:
+        """Bucle principal de sincronización."""
+        loop = asyncio.get_running_loop()
+        stop_event = self._stop_event
+        
+        logger.info("Iniciando bucle de sincronización...")
+        
+        while not stop_event.is_set():
+            deadline = loop.time() + self.sync_interval
+            
+            try:
+                if await self._perform_sync():
+                    self.sync_count += 1
+                    self.last_sync_time = time.time()
+                    logger.debug("Sincronización %s completada", self.sync_count)
+                else:
+                    self.error_count += 1
+                    logger.warning("Error en sincronización %s", self.sync_count + 1)
+            except Exception as e:
+                self.error_count += 1
+                logger.error("Error inesperado en bucle de sincronización: %s", e)
+            
+            # Esperar hasta el próximo ciclo o hasta la parada
+            try:
+                await asyncio.wait_for(
+                    stop_event.wait(), max(0, deadline - loop.time())
+                )
+            except asyncio.TimeoutError:
+                pass
+        
+        logger.info("Bucle de sincronización terminado")
+    
+    def get_status(self) -> dict:
+        """
+        Obtiene el estado actual del daemon.
+        
+        Returns:
+            Dict con información de estado
+        """
+        return {
+            'service_name': self.service_name,
+            'is_running': (
+                self._stop_event is not None and not self._stop_event.is_set()
+            ),
+            'sync_interval': self.sync_interval,
+            'sync_count': self.sync_count,
+            'error_count': self.error_count,
+            'last_sync_time': self.last_sync_time
+        }
+    
+    async def run(self) -> None:
+        """
+        Ejecuta el daemon hasta recibir SIGTERM/SIGINT o una llamada a stop().
+        """
+        self._stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(signum, self.stop)
+            except (NotImplementedError, RuntimeError):
+                # Windows o bucle fuera del hilo principal
+                pass
+        
+        logger.info("Daemon ${clean_service_name} iniciado")
+        logger.info("Intervalo de sincronización: %s segundos", self.sync_interval)
+        
+        await self._sync_loop()
+        
+        logger.info("Daemon ${clean_service_name} detenido")
+
+
+def create_daemon(
+    config_path: Optional[str] = None,
+    sync_interval: int = 60,
+    concurrency: int = 4
+) -> ${daemon_class_name}:
+    """
+    Crea una instancia del daemon asíncrono.
+    
+    Args:
+        config_path: Ruta al archivo de configuración
+        sync_interval: Intervalo de sincronización en segundos
+        concurrency: Número máximo de lotes en paralelo
+        
+    Returns:
+        Instancia del daemon configurada
+    """
+    return ${daemon_class_name}(config_path, sync_interval, concurrency)
+
+
+def main():
+    """Función principal para ejecutar el daemon desde línea de comandos."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description='Daemon asíncrono de sincronización ${clean_service_name}'
+    )
+    parser.add_argument(
+        '--config',
+        help='Archivo de configuración',
+        default=None
+    )
+    parser.add_argument(
+        '--interval',
+        type=int,
+        help='Intervalo de sincronización en segundos',
+        default=60
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        help='Número máximo de lotes sincronizándose a la vez',
+        default=4
+    )
+    parser.add_argument(
+        '--log-level',
+        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+        help='Nivel de logging',
+        default='INFO'
+    )
+    
+    args = parser.parse_args()
+    
+    # Configurar logging solo si la aplicación anfitriona no lo hizo ya
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=getattr(logging, args.log_level),
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[logging.StreamHandler(sys.stdout)]
+        )
+    
+    daemon = create_daemon(
+        config_path=args.config,
+        sync_interval=args.interval,
+        concurrency=args.concurrency
+    )
+    
+    try:
+        asyncio.run(daemon.run())
+    except KeyboardInterrupt:
+        logger.info("Interrupción por teclado recibida")
+
+
+if __name__ == "__main__":
+    main()
+'''
+
+
+_CONNECTION_TEMPLATE_SRC = '''"""
+Gestor de conexiones MySQL.
+
+Maneja conexiones seguras y eficientes a la base de datos
+con soporte para transacciones y pooling de conexiones.
+"""
+
+import logging
+import os
+import re
+import threading
+from functools import lru_cache
+import mysql.connector
+from mysql.connector import Error, pooling
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+import configparser
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    tomllib = None
+
+logger = logging.getLogger(__name__)
+
+# Configuraciones ya parseadas, por (ruta, mtime): editar el archivo invalida
+_CONFIG_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+# UPDATE/DELETE cuyo WHERE es una única igualdad con el último parámetro
+_KEYED_WHERE_RE = re.compile(
+    r"^\\s*((?:UPDATE|DELETE)\\b.*\\bWHERE\\s+)([\\w.`]+)\\s*=\\s*%s\\s*;?\\s*\\Z",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+@lru_cache(maxsize=128)
+def _split_keyed_where(query: str) -> Optional[Tuple[str, str]]:
+    """
+    Separa "... WHERE col = %s" en (texto hasta WHERE, col).
+    
+    Returns:
+        None si la sentencia no termina en esa única condición
+    """
+    match = _KEYED_WHERE_RE.match(query)
+    if match is None:
+        return None
+    return match.group(1), match.group(2)
+
+
+@lru_cache(maxsize=256)
+def _build_keyed_in_sql(head: str, key_col: str, key_count: int) -> str:
+    """Reescribe "... WHERE col = %s" como "... WHERE col IN (...)"."""
+    return f"{head}{key_col} IN ({', '.join(['%s'] * key_count)})"
+
+
+class DatabaseConnection:
+    """
+    Gestor de conexiones MySQL con pool de conexiones.
+    
+    Proporciona métodos seguros para ejecutar queries SQL
+    con manejo automático de conexiones y transacciones.
+    """
+    
+    __slots__ = (
+        'config_file',
+        'connection_config',
+        '_connection_pool',
+        '_pool_lock',
+        '_pre_ping',
+    )
+    
+    def __init__(self, config_file: str = "config/config.ini"):
+        """
+        Inicializa el gestor de conexiones.
+        
+        Args:
+            config_file: Ruta al archivo de configuración
+        """
+        self.config_file = config_file
+        self.connection_config = self._load_config()
+        self._connection_pool = None
+        self._pool_lock = threading.Lock()
+        self._pre_ping = True
+        
+    def _load_config(self) -> Dict[str, Any]:
+        """
+        Carga la configuración de MySQL desde el archivo.
+        
+        Acepta archivos .ini (configparser) y, en Python 3.11+, .toml
+        (tomllib) con la misma sección [mysql]. El resultado se reutiliza
+        mientras el archivo no se modifique.
+        """
+        try:
+            cache_key = (self.config_file, os.stat(self.config_file).st_mtime_ns)
+        except OSError:
+            cache_key = None
+        
+        if cache_key in _CONFIG_CACHE:
+            return dict(_CONFIG_CACHE[cache_key])
+        
+        try:
+            if self.config_file.endswith('.toml') and tomllib is not None:
+                with open(self.config_file, 'rb') as f:
+                    config = tomllib.load(f)
+            else:
+                config = configparser.ConfigParser()
+                config.read(self.config_file)
+            
+            if 'mysql' not in config:
+                raise ValueError("Sección [mysql] no encontrada")
+            
+            mysql_config = dict(config['mysql'])
+            
+            # Convertir puerto a entero
+            if 'port' in mysql_config:
+                mysql_config['port'] = int(mysql_config['port'])
                 
             # Configuraciones adicionales
             mysql_config.update({
@@ -1299,36 +1729,80 @@ class DatabaseConnection:
             })
             
             logger.info("Configuración MySQL cargada exitosamente")
-            return mysql_config
+            if cache_key is not None:
+                _CONFIG_CACHE[cache_key] = mysql_config
+            return dict(mysql_config)
             
         except Exception as e:
-            logger.error(f"Error cargando configuración: {e}")
+            logger.error("Error cargando configuración: %s", e)
             raise
     
+    def _get_pool(self) -> pooling.MySQLConnectionPool:
+        """
+        Obtiene el pool de conexiones, creándolo en el primer uso.
+        
+        El tamaño se toma de la clave pool_size de la sección [mysql]
+        (8 por defecto). Con pool_pre_ping = false se omite la
+        verificación de conexiones al sacarlas del pool.
+        
+        Returns:
+            Pool de conexiones compartido por esta instancia
+        """
+        if self._connection_pool is None:
+            with self._pool_lock:
+                if self._connection_pool is None:
+                    pool_config = dict(self.connection_config)
+                    pool_size = int(pool_config.pop('pool_size', 8))
+                    pool_name = pool_config.pop('pool_name', 'tabula_sync')
+                    pre_ping = str(pool_config.pop('pool_pre_ping', 'true'))
+                    self._pre_ping = pre_ping.lower() not in ('0', 'false', 'no', 'off')
+                    # Los valores del .ini llegan como texto: "false" sería
+                    # verdadero para el driver. LOAD DATA LOCAL solo se
+                    # habilita con un valor afirmativo explícito
+                    local_infile = str(pool_config.get('allow_local_infile', 'false'))
+                    pool_config['allow_local_infile'] = (
+                        local_infile.strip().lower() in ('1', 'true', 'yes', 'on')
+                    )
+                    self._connection_pool = pooling.MySQLConnectionPool(
+                        pool_name=pool_name,
+                        pool_size=pool_size,
+                        **pool_config
+                    )
+                    logger.debug("Pool MySQL creado (%s conexiones)", pool_size)
+        return self._connection_pool
+    
     @contextmanager
     def get_connection(self):
         """
-        Context manager para obtener conexión MySQL.
+        Context manager para obtener conexión MySQL del pool.
+        
+        Antes de entregarla se hace un ping: si el servidor cerró la
+        conexión por inactividad (wait_timeout) se reconecta aquí, en
+        lugar de fallar en el primer query.
         
         Yields:
-            mysql.connector.MySQLConnection: Conexión activa
+            mysql.connector.MySQLConnection: Conexión activa; al cerrarla
+            vuelve al pool
         """
         connection = None
         try:
-            connection = mysql.connector.connect(**self.connection_config)
-            logger.debug("Conexión MySQL establecida")
+            connection = self._get_pool().get_connection()
+            if self._pre_ping:
+                connection.ping(reconnect=True, attempts=1)
+            logger.debug("Conexión MySQL obtenida del pool")
             yield connection
             
         except Error as e:
-            logger.error(f"Error de conexión MySQL: {e}")
+            logger.error("Error de conexión MySQL: %s", e)
             if connection:
                 connection.rollback()
             raise
             
         finally:
-            if connection and connection.is_connected():
+            if connection:
+                # En conexiones del pool, close() la devuelve al pool
                 connection.close()
-                logger.debug("Conexión MySQL cerrada")
+                logger.debug("Conexión MySQL devuelta al pool")
     
     def execute_query(self, query: str, params: Optional[Tuple] = None):
         """
@@ -1341,22 +1815,62 @@ class DatabaseConnection:
         Returns:
             Lista de diccionarios con resultados
         """
+        cursor = None
         try:
             with self.get_connection() as connection:
                 cursor = connection.cursor(dictionary=True)
                 
-                logger.debug(f"Ejecutando query: {query}")
+                logger.debug("Ejecutando query: %s", query)
                 cursor.execute(query, params or ())
                 results = cursor.fetchall()
                 
-                logger.debug(f"Query exitoso. Filas: {len(results)}")
+                logger.debug("Query exitoso. Filas: %s", len(results))
                 return results
                 
         except Error as e:
-            logger.error(f"Error en query: {e}")
+            logger.error("Error en query: %s", e)
             raise
         finally:
-            if 'cursor' in locals():
+            if cursor is not None:
+                cursor.close()
+    
+    def iter_query(
+        self, query: str, params: Optional[Tuple] = None, arraysize: int = 1000
+    ):
+        """
+        Ejecuta consulta SELECT y entrega los resultados fila a fila.
+        
+        Las filas se leen del servidor en bloques de arraysize, así que la
+        memoria usada no depende del tamaño del resultado. Preferible a
+        execute_query cuando el resultado solo se recorre una vez.
+        
+        Args:
+            query: Query SQL a ejecutar
+            params: Parámetros para el query
+            arraysize: Filas leídas por bloque
+            
+        Yields:
+            Diccionario con cada fila
+        """
+        with self.get_connection() as connection:
+            cursor = connection.cursor(dictionary=True)
+            try:
+                logger.debug("Ejecutando query: %s", query)
+                cursor.execute(query, params or ())
+                
+                while True:
+                    rows = cursor.fetchmany(arraysize)
+                    if not rows:
+                        break
+                    yield from rows
+                    
+            except Error as e:
+                logger.error("Error en query: %s", e)
+                raise
+            finally:
+                # Si el consumidor se detuvo antes, descartar filas pendientes
+                if connection.unread_result:
+                    connection.consume_results()
                 cursor.close()
     
     def execute_update(self, query: str, params: Optional[Tuple] = None):
@@ -1370,32 +1884,44 @@ class DatabaseConnection:
         Returns:
             Número de filas afectadas
         """
+        cursor = None
         try:
             with self.get_connection() as connection:
                 cursor = connection.cursor()
                 
-                logger.debug(f"Ejecutando update: {query}")
+                logger.debug("Ejecutando update: %s", query)
                 cursor.execute(query, params or ())
                 connection.commit()
                 
                 affected_rows = cursor.rowcount
-                logger.debug(f"Update exitoso. Filas afectadas: {affected_rows}")
+                logger.debug("Update exitoso. Filas afectadas: %s", affected_rows)
                 return affected_rows
                 
         except Error as e:
-            logger.error(f"Error en update: {e}")
+            logger.error("Error en update: %s", e)
             raise
         finally:
-            if 'cursor' in locals():
+            if cursor is not None:
                 cursor.close()
     
-    def execute_batch(self, query: str, params_list: List[Tuple]):
+    def execute_batch(
+        self, query: str, params_list: List[Tuple], chunk_size: int = 500
+    ):
         """
         Ejecuta múltiples queries en lote.
         
+        Los INSERT se envían con executemany en bloques de chunk_size filas
+        (cada bloque se reescribe como un solo INSERT multi-fila). Los
+        UPDATE/DELETE que terminan en "WHERE col = %s" se agrupan por el
+        resto de parámetros y se envían como "WHERE col IN (...)", una
+        sentencia por bloque de chunk_size claves. El resto, o si alguna
+        clave se repite, se ejecuta fila por fila sobre un cursor
+        preparado. Todo se confirma en una única transacción.
+        
         Args:
             query: Query SQL a ejecutar
             params_list: Lista de parámetros para cada ejecución
+            chunk_size: Filas o claves por sentencia
             
         Returns:
             Total de filas afectadas
@@ -1404,85 +1930,213 @@ class DatabaseConnection:
             return 0
             
         try:
-            with self.get_connection() as connection:
-                cursor = connection.cursor()
-                
-                logger.debug(f"Ejecutando batch: {len(params_list)} items")
-                cursor.executemany(query, params_list)
-                connection.commit()
-                
-                total_affected = cursor.rowcount
-                logger.debug(f"Batch exitoso: {total_affected} filas")
-                return total_affected
-                
+            logger.debug("Ejecutando batch: %s items", len(params_list))
+            if query.lstrip()[:6].upper() == 'INSERT':
+                total_affected = self._execute_insert_batch(
+                    query, params_list, chunk_size
+                )
+            else:
+                statements = self._keyed_batch_statements(
+                    query, params_list, chunk_size
+                )
+                if statements is not None:
+                    total_affected = self.execute_transaction(statements)
+                else:
+                    total_affected = 0
+                    with self.transaction(prepared=True) as cursor:
+                        for params in params_list:
+                            cursor.execute(query, params)
+                            total_affected += max(cursor.rowcount, 0)
+                    
+            logger.debug("Batch exitoso: %s filas", total_affected)
+            return total_affected
+            
         except Error as e:
-            logger.error(f"Error en batch: {e}")
+            logger.error("Error en batch: %s", e)
             raise
-        finally:
-            if 'cursor' in locals():
-                cursor.close()
     
-    def test_connection(self) -> bool:
+    def _execute_insert_batch(
+        self, query: str, params_list: List[Tuple], chunk_size: int
+    ) -> int:
+        """Envía un INSERT con executemany, un bloque por sentencia."""
+        total_affected = 0
+        with self.transaction() as cursor:
+            for start in range(0, len(params_list), chunk_size):
+                cursor.executemany(query, params_list[start:start + chunk_size])
+                total_affected += max(cursor.rowcount, 0)
+        return total_affected
+    
+    @staticmethod
+    def _keyed_batch_statements(
+        query: str, params_list: List[Tuple], chunk_size: int
+    ) -> Optional[List[Tuple[str, Tuple]]]:
         """
-        Prueba la conexión a la base de datos.
+        Convierte un lote "... WHERE col = %s" en sentencias con IN (...).
+        
+        Las filas con los mismos parámetros restantes (valores del SET)
+        comparten sentencia. Con claves repetidas no se reescribe: fila
+        por fila una expresión como "n = n + 1" se aplicaría dos veces.
         
         Returns:
-            bool: True si la conexión es exitosa
+            Pares (query, params) o None si el lote no admite la reescritura
         """
-        try:
-            with self.get_connection() as connection:
-                cursor = connection.cursor()
-                cursor.execute("SELECT 1")
-                result = cursor.fetchone()
-                cursor.close()
-                
-                logger.info("Prueba de conexión exitosa")
-                return result is not None
-                
-        except Exception as e:
-            logger.error(f"Prueba de conexión falló: {e}")
-            return False
-
-
-# Instancia global para reutilizar
-_db_instance = None
-
-def get_db_connection(config_file: str = "config/config.ini"):
-    """
-    Obtiene instancia singleton de DatabaseConnection.
+        keyed = _split_keyed_where(query)
+        if keyed is None:
+            return None
+        head, key_col = keyed
+        
+        groups: Dict[Tuple, List[Any]] = {}
+        seen = set()
+        for params in params_list:
+            params = tuple(params)
+            key = params[-1]
+            if key in seen:
+                return None
+            seen.add(key)
+            groups.setdefault(params[:-1], []).append(key)
+        
+        statements = []
+        for rest, keys in groups.items():
+            for start in range(0, len(keys), chunk_size):
+                chunk = tuple(keys[start:start + chunk_size])
+                sql = _build_keyed_in_sql(head, key_col, len(chunk))
+                statements.append((sql, rest + chunk))
+        return statements
     
-    Args:
-        config_file: Archivo de configuración
+    @contextmanager
+    def transaction(self, prepared: bool = False):
+        """
+        Context manager para agrupar varias sentencias en una transacción.
         
-    Returns:
-        Instancia de DatabaseConnection
-    """
-    global _db_instance
-    
-    if _db_instance is None:
-        _db_instance = DatabaseConnection(config_file)
+        Entrega un cursor sobre una única conexión del pool. Al salir sin
+        errores se hace un solo commit; ante cualquier excepción se
+        revierte todo.
         
-    return _db_instance
+        Args:
+            prepared: Usar un cursor preparado en el servidor
+            
+        Yields:
+            Cursor de la conexión de la transacción
+        """
+        with self.get_connection() as connection:
+            cursor = connection.cursor(prepared=prepared)
+            try:
+                yield cursor
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+    
+    def execute_transaction(self, statements: Iterable[Tuple[str, Tuple]]):
+        """
+        Ejecuta varias sentencias en una sola transacción.
+        
+        Todas usan la misma conexión y se confirman con un único commit;
+        si alguna falla se revierten todas.
+        
+        Args:
+            statements: Pares (query, params) a ejecutar en orden
+            
+        Returns:
+            Total de filas afectadas
+        """
+        total_affected = 0
+        try:
+            with self.transaction() as cursor:
+                for query, params in statements:
+                    logger.debug("Ejecutando en transacción: %s", query)
+                    cursor.execute(query, params or ())
+                    total_affected += max(cursor.rowcount, 0)
+                    
+        except Error as e:
+            logger.error("Error en transacción: %s", e)
+            raise
+        
+        logger.debug("Transacción exitosa: %s filas", total_affected)
+        return total_affected
+    
+    def test_connection(self) -> bool:
+        """
+        Prueba la conexión a la base de datos.
+        
+        Returns:
+            bool: True si la conexión es exitosa
+        """
+        try:
+            with self.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute("SELECT 1")
+                result = cursor.fetchone()
+                cursor.close()
+                
+                logger.info("Prueba de conexión exitosa")
+                return result is not None
+                
+        except Exception as e:
+            logger.error("Prueba de conexión falló: %s", e)
+            return False
+
+
+# Una instancia por archivo de configuración
+@lru_cache(maxsize=None)
+def get_db_connection(config_file: str = "config/config.ini"):
+    """
+    Obtiene la instancia compartida de DatabaseConnection.
+    
+    Args:
+        config_file: Archivo de configuración
+        
+    Returns:
+        Instancia de DatabaseConnection
+    """
+    return DatabaseConnection(config_file)
 '''
 
-        (database_dir / "connection.py").write_text(connection_content)
-        logger.debug("Archivo connection.py creado")
 
-    def _create_select_queries_file(
-        self, queries_dir: Path, project_name: str
-    ) -> None:
-        """Crea el archivo select_queries.py con consultas SELECT."""
-        select_content = f'''"""
-Queries de consulta (SELECT) para {project_name}.
+_SELECT_QUERIES_TEMPLATE_SRC = '''"""
+Queries de consulta (SELECT) para ${project_name}.
 
 Organiza todas las consultas SELECT por funcionalidad
 para facilitar mantenimiento y reutilización.
 """
 
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from ..connection import get_db_connection
 
 
+# Sentencias fijas: se arman una sola vez al importar el módulo
+QUERY_ACTIVE_RECORDS = "SELECT * FROM main_table WHERE active = 1"
+QUERY_RECORDS_BY_DATE_RANGE = """
+        SELECT * FROM main_table 
+        WHERE DATE(created_at) BETWEEN %s AND %s
+        ORDER BY created_at DESC
+        """
+QUERY_CONFIG_VALUE = "SELECT config_value FROM configuraciones WHERE config_key = %s"
+QUERY_ALL_CONFIGS = "SELECT config_key, config_value FROM configuraciones"
+
+
+# Sentencias por tabla de las consultas más frecuentes
+
+@lru_cache(maxsize=256)
+def _build_get_by_id_sql(table_name: str) -> str:
+    """Arma el SELECT por ID de una tabla."""
+    return f"SELECT * FROM {table_name} WHERE id = %s"
+
+
+@lru_cache(maxsize=256)
+def _build_pending_sync_sql(table_name: str) -> str:
+    """Arma el SELECT de registros pendientes de una tabla."""
+    return f"""
+        SELECT * FROM {table_name} 
+        WHERE sync_status = 'pending' 
+        ORDER BY created_at ASC 
+        LIMIT %s
+        """
+
+
 class SelectQueries:
     """
     Queries para consultar datos de la base de datos.
@@ -1490,6 +2144,9 @@ class SelectQueries:
     Organiza consultas SELECT por categorías de funcionalidad.
     """
     
+    # Agregar aquí cualquier atributo nuevo que se asigne en __init__
+    __slots__ = ('db',)
+    
     def __init__(self, config_file: str = "config/config.ini"):
         """
         Inicializa las queries de consulta.
@@ -1513,7 +2170,7 @@ class SelectQueries:
         Returns:
             Lista de registros
         """
-        query = f"SELECT * FROM {{table_name}}"
+        query = f"SELECT * FROM {table_name}"
         return self.db.execute_query(query)
     
     def get_record_by_id(self, table_name: str, record_id):
@@ -1527,7 +2184,7 @@ class SelectQueries:
         Returns:
             Registro encontrado o None
         """
-        query = f"SELECT * FROM {{table_name}} WHERE id = %s"
+        query = _build_get_by_id_sql(table_name)
         results = self.db.execute_query(query, (record_id,))
         return results[0] if results else None
     
@@ -1542,9 +2199,9 @@ class SelectQueries:
         Returns:
             Número de registros
         """
-        query = f"SELECT COUNT(*) as total FROM {{table_name}}"
+        query = f"SELECT COUNT(*) as total FROM {table_name}"
         if where_condition:
-            query += f" WHERE {{where_condition}}"
+            query += f" WHERE {where_condition}"
         
         result = self.db.execute_query(query)
         return result[0]['total'] if result else 0
@@ -1563,13 +2220,11 @@ class SelectQueries:
             
         Returns:
             Lista de registros pendientes
+            
+        Para lotes grandes que solo se recorren una vez, ejecutar el mismo
+        query con self.db.iter_query evita cargarlo entero en memoria.
         """
-        query = f"""
-        SELECT * FROM {{table_name}} 
-        WHERE sync_status = 'pending' 
-        ORDER BY created_at ASC 
-        LIMIT %s
-        """
+        query = _build_pending_sync_sql(table_name)
         return self.db.execute_query(query, (limit,))
     
     def get_failed_sync_records(self, table_name: str, max_retries: int = 3):
@@ -1584,7 +2239,7 @@ class SelectQueries:
             Lista de registros con errores
         """
         query = f"""
-        SELECT * FROM {{table_name}} 
+        SELECT * FROM {table_name} 
         WHERE sync_status = 'failed' 
         AND sync_retries < %s
         ORDER BY last_sync_attempt ASC
@@ -1603,31 +2258,27 @@ class SelectQueries:
             Lista de registros modificados
         """
         query = f"""
-        SELECT * FROM {{table_name}} 
+        SELECT * FROM {table_name} 
         WHERE updated_at > %s 
         ORDER BY updated_at ASC
         """
         return self.db.execute_query(query, (timestamp,))
     
     # =================================================================
-    # QUERIES ESPECÍFICAS PARA {project_name.upper()} - Personalizar según negocio
+    # QUERIES ESPECÍFICAS PARA ${project_upper} - Personalizar según negocio
     # =================================================================
     
     def get_active_records(self):
         """Obtiene registros activos."""
-        query = "SELECT * FROM main_table WHERE active = 1"
-        return self.db.execute_query(query)
+        return self.db.execute_query(QUERY_ACTIVE_RECORDS)
     
     def get_records_by_date_range(self, start_date: str, end_date: str):
         """Obtiene registros por rango de fechas."""
-        query = """
-        SELECT * FROM main_table 
-        WHERE DATE(created_at) BETWEEN %s AND %s
-        ORDER BY created_at DESC
-        """
-        return self.db.execute_query(query, (start_date, end_date))
+        return self.db.execute_query(
+            QUERY_RECORDS_BY_DATE_RANGE, (start_date, end_date)
+        )
     
-    # TODO: Agregar queries específicas para {project_name}
+    # TODO: Agregar queries específicas para ${project_name}
     # Ejemplos:
     # - get_productos_con_stock_bajo()
     # - get_facturas_del_mes()
@@ -1648,689 +2299,579 @@ class SelectQueries:
         Returns:
             Valor de configuración o None
         """
-        query = "SELECT config_value FROM configuraciones WHERE config_key = %s"
-        results = self.db.execute_query(query, (config_key,))
+        results = self.db.execute_query(QUERY_CONFIG_VALUE, (config_key,))
         return results[0]['config_value'] if results else None
     
     def get_all_configs(self):
         """Obtiene todas las configuraciones como diccionario."""
-        query = "SELECT config_key, config_value FROM configuraciones"
-        results = self.db.execute_query(query)
-        return {{row['config_key']: row['config_value'] for row in results}}
-
+        results = self.db.execute_query(QUERY_ALL_CONFIGS)
+        return {row['config_key']: row['config_value'] for row in results}
 
-# Instancia global para reutilizar
-_select_queries = None
 
+# Una instancia por archivo de configuración
+@lru_cache(maxsize=None)
 def get_select_queries(config_file: str = "config/config.ini"):
-    """Obtiene instancia singleton de SelectQueries."""
-    global _select_queries
-    
-    if _select_queries is None:
-        _select_queries = SelectQueries(config_file)
-        
-    return _select_queries
+    """Obtiene la instancia compartida de SelectQueries."""
+    return SelectQueries(config_file)
 '''
 
-        (queries_dir / "select_queries.py").write_text(select_content)
-        logger.debug("Archivo select_queries.py creado")
 
-    def _create_update_queries_file(
-        self, queries_dir: Path, project_name: str
-    ) -> None:
-        """Crea el archivo update_queries.py con consultas de actualización."""
-        update_content = f'''"""
-Queries de actualización (UPDATE/INSERT) para {project_name}.
+# Templates grandes de la estructura de database: viven como archivos
+# .pytpl en el paquete y solo se leen cuando se necesitan
+_TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
 
-Organiza todas las consultas para modificar y agregar datos
-en la base de datos local.
-"""
+_TEMPLATE_FILES = {
+    "update_queries": "update_queries.pytpl",
+    "repository": "repository.pytpl",
+    "custom_queries": "custom_queries.pytpl",
+}
 
-from typing import Dict, Any, List, Tuple
-from datetime import datetime
-from ..connection import get_db_connection
+
+_TEMPLATE_SOURCES = {
+    "service": _SERVICE_TEMPLATE_SRC,
+    "model": _MODEL_TEMPLATE_SRC,
+    "daemon": _DAEMON_TEMPLATE_SRC,
+    "async_daemon": _ASYNC_DAEMON_TEMPLATE_SRC,
+    "connection": _CONNECTION_TEMPLATE_SRC,
+    "select_queries": _SELECT_QUERIES_TEMPLATE_SRC,
+}
 
 
-class UpdateQueries:
+@lru_cache(maxsize=None)
+def _get_template(name: str) -> Template:
     """
-    Queries para actualizar y insertar datos en la base de datos.
-    
-    Organiza consultas de modificación por funcionalidad.
+    Obtiene el template compilado para un tipo de archivo.
+
+    Cada template se construye una sola vez por proceso y se reutiliza
+    en todas las llamadas a los métodos ``generate_*``. Los registrados en
+    ``_TEMPLATE_FILES`` se leen del directorio de templates del paquete.
+
+    Args:
+        name: Tipo de template (service, model, daemon o archivo de database)
+
+    Returns:
+        Template listo para sustituir
     """
-    
-    def __init__(self, config_file: str = "config/config.ini"):
+    filename = _TEMPLATE_FILES.get(name)
+    if filename is not None:
+        return Template((_TEMPLATES_DIR / filename).read_text(encoding="utf-8"))
+    return Template(_TEMPLATE_SOURCES[name])
+
+
+def _strip_suffix(text: str, suffix: str) -> str:
+    """
+    Elimina un sufijo del final del texto si está presente.
+
+    Equivalente a ``str.removesuffix`` (Python 3.9+), disponible en todas
+    las versiones soportadas. Devuelve el mismo objeto si no hay coincidencia.
+    """
+    if text.endswith(suffix):
+        return text[: -len(suffix)]
+    return text
+
+
+def _write_if_changed(path: str, content: bytes) -> bool:
+    """
+    Escribe el contenido solo si difiere del archivo existente.
+
+    Args:
+        path: Ruta del archivo de salida
+        content: Contenido ya codificado
+
+    Returns:
+        True si el archivo se escribió, False si ya estaba actualizado
+    """
+    try:
+        if os.stat(path).st_size == len(content):
+            with open(path, "rb") as f:
+                if f.read() == content:
+                    return False
+    except OSError:
+        pass
+
+    with open(path, "wb") as f:
+        f.write(content)
+    return True
+
+
+@lru_cache(maxsize=256)
+def _identifiers(name: str, suffix: str) -> Tuple[str, str, str]:
+    """
+    Calcula los identificadores derivados de un nombre de servicio o modelo.
+
+    Args:
+        name: Nombre indicado por el usuario (ej: "ClientesService")
+        suffix: Sufijo del tipo de archivo (ej: "Service")
+
+    Returns:
+        Tupla (nombre limpio, nombre de clase, nombre de módulo)
+    """
+    clean_name = _strip_suffix(_strip_suffix(name, suffix), suffix.lower())
+    return (
+        clean_name,
+        f"{clean_name}{suffix}",
+        f"{clean_name.lower()}_{suffix.lower()}",
+    )
+
+
+def _project_names(project_name: str) -> Dict[str, str]:
+    """
+    Calcula las variantes del nombre de proyecto usadas por los templates.
+
+    Args:
+        project_name: Nombre del proyecto
+
+    Returns:
+        Diccionario listo para pasar a ``Template.substitute``
+    """
+    return {
+        "project_name": project_name,
+        "project_upper": project_name.upper(),
+        "project_title": project_name.title(),
+    }
+
+
+class TemplateGenerator:
+    """
+    Generador de templates de código para proyectos Tabula Cloud Sync.
+
+    Crea archivos base de servicios, modelos y daemons con estructura
+    predefinida y mejores prácticas incluidas.
+    """
+
+    def __init__(self, project_root: Path):
         """
-        Inicializa las queries de actualización.
-        
+        Inicializa el generador de templates.
+
         Args:
-            config_file: Archivo de configuración de la BD
+            project_root: Directorio raíz del proyecto
         """
-        self.db = get_db_connection(config_file)
-    
-    # =================================================================
-    # QUERIES GENERALES - Para cualquier tabla
-    # =================================================================
-    
-    def update_record_by_id(self, table_name: str, record_id, data: Dict[str, Any]):
+        self.project_root = Path(project_root)
+        root = os.fspath(self.project_root)
+        self._services_str = os.path.join(root, "services")
+        self._models_str = os.path.join(root, "models")
+        self._ensured = set()
+        self._pending_writes: List[Tuple[str, bytes]] = []
+        # generate_all y generate_bulk generan desde varios hilos
+        self._lock = threading.Lock()
+        self.warmup()
+
+    @classmethod
+    def warmup(cls) -> None:
         """
-        Actualiza un registro por ID.
-        
-        Args:
-            table_name: Nombre de la tabla
-            record_id: ID del registro
-            data: Datos a actualizar
-            
-        Returns:
-            Número de filas afectadas
+        Precarga todos los templates de código.
+
+        Así la primera llamada a ``generate_*`` tiene la misma latencia que
+        las siguientes. Es idempotente: los templates ya cargados se
+        reutilizan.
         """
-        if not data:
-            return 0
-            
-        set_clause = ", ".join([f"{{key}} = %s" for key in data.keys()])
-        query = f"UPDATE {{table_name}} SET {{set_clause}} WHERE id = %s"
-        params = tuple(data.values()) + (record_id,)
-        
-        return self.db.execute_update(query, params)
-    
-    def insert_record(self, table_name: str, data: Dict[str, Any]):
+        for name in _TEMPLATE_SOURCES:
+            _get_template(name)
+        for name in _TEMPLATE_FILES:
+            _get_template(name)
+
+    @property
+    def services_dir(self) -> Path:
+        """Directorio por defecto para servicios y daemons."""
+        return Path(self._services_str)
+
+    @property
+    def models_dir(self) -> Path:
+        """Directorio por defecto para modelos."""
+        return Path(self._models_str)
+
+    def _prepare_output_dir(
+        self, output_dir: Optional[Path], default_dir: str
+    ) -> str:
         """
-        Inserta un nuevo registro.
-        
+        Resuelve el directorio de salida y lo crea solo la primera vez.
+
         Args:
-            table_name: Nombre de la tabla
-            data: Datos a insertar
-            
+            output_dir: Directorio de salida personalizado
+            default_dir: Directorio por defecto ya convertido a str
+
         Returns:
-            Número de filas afectadas
+            Ruta del directorio de salida como str
         """
-        if not data:
-            return 0
-            
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(["%s"] * len(data))
-        query = f"INSERT INTO {{table_name}} ({{columns}}) VALUES ({{placeholders}})"
-        
-        return self.db.execute_update(query, tuple(data.values()))
-    
-    def upsert_record(self, table_name: str, data: Dict[str, Any], key_col: str = "id"):
+        directory = os.fspath(output_dir) if output_dir else default_dir
+        self._ensure_dirs(directory)
+        return directory
+
+    def _ensure_dirs(self, *directories: str) -> None:
+        """Crea los directorios que todavía no se crearon en esta instancia."""
+        with self._lock:
+            for directory in directories:
+                if directory not in self._ensured:
+                    os.makedirs(directory, exist_ok=True)
+                    self._ensured.add(directory)
+
+    def _buffer_write(self, path: str, content: str) -> None:
         """
-        Inserta o actualiza un registro (UPSERT).
-        
+        Encola un archivo para escribirlo en el próximo ``flush()``.
+
         Args:
-            table_name: Nombre de la tabla
-            data: Datos a insertar/actualizar
-            key_col: Columna clave para conflicto
-            
-        Returns:
-            Número de filas afectadas
-        """
-        if not data:
-            return 0
-            
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(["%s"] * len(data))
-        
-        update_clause = ", ".join([
-            f"{{key}} = VALUES({{key}})" for key in data.keys() 
-            if key != key_col
-        ])
-        
-        query = f"""
-        INSERT INTO {{table_name}} ({{columns}}) 
-        VALUES ({{placeholders}})
-        ON DUPLICATE KEY UPDATE {{update_clause}}
+            path: Ruta del archivo de salida
+            content: Contenido del archivo
         """
-        
-        return self.db.execute_update(query, tuple(data.values()))
-    
-    # =================================================================
-    # QUERIES PARA SINCRONIZACIÓN - Control de estados
-    # =================================================================
-    
-    def mark_as_synced(self, table_name: str, record_id):
+        data = content.encode("utf-8")
+        with self._lock:
+            self._pending_writes.append((path, data))
+
+    def flush(self) -> int:
         """
-        Marca un registro como sincronizado.
-        
-        Args:
-            table_name: Nombre de la tabla
-            record_id: ID del registro
-            
+        Escribe todos los archivos encolados con ``_buffer_write``.
+
+        Usa ``os.open``/``os.write`` directamente, sin capas de buffering
+        ni decodificación por archivo.
+
         Returns:
-            Número de filas afectadas
+            Número de archivos escritos
         """
-        query = f"""
-        UPDATE {{table_name}} 
-        SET sync_status = 'synced', 
-            last_sync_at = NOW(),
-            sync_retries = 0,
-            sync_error = NULL
-        WHERE id = %s
-        """
-        return self.db.execute_update(query, (record_id,))
-    
-    def mark_sync_failed(self, table_name: str, record_id, error_message: str):
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        with self._lock:
+            pending, self._pending_writes = self._pending_writes, []
+
+        for path, data in pending:
+            fd = os.open(path, flags, 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+
+        return len(pending)
+
+    def generate_service_template(
+        self,
+        service_name: str,
+        project_name: str,
+        output_dir: Optional[Path] = None,
+    ) -> Path:
         """
-        Marca un registro como fallido en sincronización.
-        
+        Genera un template de servicio base.
+
         Args:
-            table_name: Nombre de la tabla
-            record_id: ID del registro
-            error_message: Mensaje de error
-            
+            service_name: Nombre del servicio a crear
+            project_name: Nombre del proyecto
+            output_dir: Directorio de salida personalizado
+
         Returns:
-            Número de filas afectadas
-        """
-        query = f"""
-        UPDATE {{table_name}} 
-        SET sync_status = 'failed',
-            sync_retries = sync_retries + 1,
-            sync_error = %s,
-            last_sync_attempt = NOW()
-        WHERE id = %s
+            Path al archivo generado
         """
-        return self.db.execute_update(query, (error_message, record_id))
-    
-    def mark_for_sync(self, table_name: str, record_id):
+        output_dir = self._prepare_output_dir(output_dir, self._services_str)
+
+        clean_service_name, service_class_name, module_name = _identifiers(
+            service_name, "Service"
+        )
+        filename = f"{module_name}.py"
+
+        template_content = _get_template("service").substitute(
+            project_name=project_name,
+            clean_service_name=clean_service_name,
+            service_class_name=service_class_name,
+        )
+
+        output_file = os.path.join(output_dir, filename)
+        if _write_if_changed(output_file, template_content.encode("utf-8")):
+            logger.info("Template de servicio generado: %s", output_file)
+        else:
+            logger.debug("Template de servicio sin cambios: %s", output_file)
+        return Path(output_file)
+
+    def generate_model_template(
+        self, model_name: str, output_dir: Optional[Path] = None
+    ) -> Path:
         """
-        Marca un registro como pendiente de sincronización.
-        
-        Args:
-            table_name: Nombre de la tabla
-            record_id: ID del registro
-            
+        Genera un template de modelo base.
+
+        Args:
+            model_name: Nombre del modelo a crear
+            output_dir: Directorio de salida personalizado
+
         Returns:
-            Número de filas afectadas
-        """
-        query = f"""
-        UPDATE {{table_name}} 
-        SET sync_status = 'pending',
-            updated_at = NOW()
-        WHERE id = %s
+            Path al archivo generado
         """
-        return self.db.execute_update(query, (record_id,))
-    
-    # =================================================================
-    # QUERIES ESPECÍFICAS PARA {project_name.upper()} - Tu lógica de negocio
-    # =================================================================
-    
-    def update_status(self, record_id, new_status: str):
-        """Actualiza el estado de un registro."""
-        query = "UPDATE main_table SET status = %s WHERE id = %s"
-        return self.db.execute_update(query, (new_status, record_id))
-    
-    # TODO: Agregar queries específicas para {project_name}
-    # Ejemplos:
-    # - actualizar_stock_producto()
-    # - crear_nueva_factura()
-    # - actualizar_saldo_cliente()
-    # - completar_pedido()
-    
-    # =================================================================
-    # QUERIES EN LOTE - Para operaciones masivas
-    # =================================================================
-    
-    def update_multiple_records(self, table_name: str, updates: List[Tuple]):
+        output_dir = self._prepare_output_dir(output_dir, self._models_str)
+
+        clean_model_name, model_class_name, module_name = _identifiers(
+            model_name, "Model"
+        )
+        filename = f"{module_name}.py"
+
+        template_content = _get_template("model").substitute(
+            clean_model_name=clean_model_name,
+            model_class_name=model_class_name,
+        )
+
+        output_file = os.path.join(output_dir, filename)
+        if _write_if_changed(output_file, template_content.encode("utf-8")):
+            logger.info("Template de modelo generado: %s", output_file)
+        else:
+            logger.debug("Template de modelo sin cambios: %s", output_file)
+        return Path(output_file)
+
+    def generate_daemon_template(
+        self, service_name: str, output_dir: Optional[Path] = None
+    ) -> Path:
         """
-        Actualiza múltiples registros en lote.
-        
+        Genera un template de daemon base.
+
         Args:
-            table_name: Nombre de la tabla
-            updates: Lista de tuplas (nuevo_valor, id)
-            
+            service_name: Nombre del servicio para el daemon
+            output_dir: Directorio de salida personalizado
+
         Returns:
-            Total de filas afectadas
+            Path al archivo generado
         """
-        if not updates:
-            return 0
-            
-        query = f"UPDATE {{table_name}} SET status = %s WHERE id = %s"
-        return self.db.execute_batch(query, updates)
-    
-    def insert_multiple_records(self, table_name: str, records: List[Dict[str, Any]]):
+        output_dir = self._prepare_output_dir(output_dir, self._services_str)
+
+        clean_service_name, _, service_module = _identifiers(
+            service_name, "Service"
+        )
+        daemon_class_name = f"{clean_service_name}Daemon"
+        filename = f"{clean_service_name.lower()}_daemon.py"
+
+        template_content = _get_template("daemon").substitute(
+            clean_service_name=clean_service_name,
+            daemon_class_name=daemon_class_name,
+            service_module=service_module,
+        )
+
+        output_file = os.path.join(output_dir, filename)
+        if _write_if_changed(output_file, template_content.encode("utf-8")):
+            logger.info("Template de daemon generado: %s", output_file)
+        else:
+            logger.debug("Template de daemon sin cambios: %s", output_file)
+        return Path(output_file)
+
+    def generate_async_daemon_template(
+        self, service_name: str, output_dir: Optional[Path] = None
+    ) -> Path:
         """
-        Inserta múltiples registros en lote.
-        
+        Genera un template de daemon asíncrono basado en asyncio.
+
+        Alternativa a generate_daemon_template para servicios cuya
+        sincronización está dominada por E/S de red y base de datos.
+
         Args:
-            table_name: Nombre de la tabla
-            records: Lista de diccionarios con datos
-            
+            service_name: Nombre del servicio para el daemon
+            output_dir: Directorio de salida personalizado
+
         Returns:
-            Total de filas afectadas
+            Path al archivo generado
         """
-        if not records:
-            return 0
-            
-        columns = list(records[0].keys())
-        columns_str = ", ".join(columns)
-        placeholders = ", ".join(["%s"] * len(columns))
-        
-        query = f"INSERT INTO {{table_name}} ({{columns_str}}) VALUES ({{placeholders}})"
-        values_list = [tuple(rec[col] for col in columns) for rec in records]
-        
-        return self.db.execute_batch(query, values_list)
-    
-    # =================================================================
-    # QUERIES DE CONFIGURACIÓN
-    # =================================================================
-    
-    def set_config_value(self, config_key: str, config_value: str):
+        output_dir = self._prepare_output_dir(output_dir, self._services_str)
+
+        clean_service_name, _, service_module = _identifiers(
+            service_name, "Service"
+        )
+        daemon_class_name = f"{clean_service_name}AsyncDaemon"
+        filename = f"{clean_service_name.lower()}_async_daemon.py"
+
+        template_content = _get_template("async_daemon").substitute(
+            clean_service_name=clean_service_name,
+            daemon_class_name=daemon_class_name,
+            service_module=service_module,
+        )
+
+        output_file = os.path.join(output_dir, filename)
+        if _write_if_changed(output_file, template_content.encode("utf-8")):
+            logger.info("Template de daemon asíncrono generado: %s", output_file)
+        else:
+            logger.debug(
+                "Template de daemon asíncrono sin cambios: %s", output_file
+            )
+        return Path(output_file)
+
+    def generate_bulk(
+        self,
+        service_names: Iterable[str],
+        project_name: str,
+        model_names: Iterable[str] = (),
+    ) -> List[Path]:
         """
-        Establece un valor de configuración.
-        
+        Genera en paralelo los templates de varios servicios y modelos.
+
+        Por cada servicio se generan su archivo de servicio y su daemon.
+        Cada archivo es independiente, por lo que las escrituras se
+        reparten en un pool de hilos. Los nombres que producen los mismos
+        archivos se generan una sola vez, para que dos hilos no escriban
+        a la vez la misma ruta.
+
         Args:
-            config_key: Clave de configuración
-            config_value: Valor de configuración
-            
+            service_names: Nombres de los servicios a crear
+            project_name: Nombre del proyecto
+            model_names: Nombres de los modelos a crear
+
         Returns:
-            Número de filas afectadas
+            Lista de Paths generados, en el orden de los nombres recibidos
+        """
+        max_workers = min(32, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            # Futures por archivo de destino (nombre limpio en minúsculas)
+            submitted = {}
+            for name in service_names:
+                key = ("service", _identifiers(name, "Service")[0].lower())
+                if key not in submitted:
+                    submitted[key] = (
+                        executor.submit(
+                            self.generate_service_template, name, project_name
+                        ),
+                        executor.submit(self.generate_daemon_template, name),
+                    )
+                futures.extend(submitted[key])
+            for name in model_names:
+                key = ("model", _identifiers(name, "Model")[0].lower())
+                if key not in submitted:
+                    submitted[key] = (
+                        executor.submit(self.generate_model_template, name),
+                    )
+                futures.extend(submitted[key])
+            return [future.result() for future in futures]
+
+    def generate_all(
+        self, project_name: str, service_name: Optional[str] = None
+    ) -> Tuple[Path, Path, Path]:
+        """
+        Genera en paralelo todos los archivos de un proyecto nuevo.
+
+        Crea servicio, modelo, daemon y la estructura de database; cada
+        uno escribe archivos distintos a partir de templates inmutables,
+        así que pueden generarse a la vez.
+
+        Args:
+            project_name: Nombre del proyecto
+            service_name: Nombre del servicio (por defecto
+                ``<project_name>Service``)
+
+        Returns:
+            Tupla (servicio, modelo, daemon) con los Paths generados
         """
-        query = """
-        INSERT INTO configuraciones (config_key, config_value, updated_at)
-        VALUES (%s, %s, NOW())
-        ON DUPLICATE KEY UPDATE 
-        config_value = VALUES(config_value),
-        updated_at = NOW()
+        service_name = service_name or f"{project_name}Service"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            service_future = executor.submit(
+                self.generate_service_template, service_name, project_name
+            )
+            model_future = executor.submit(
+                self.generate_model_template, f"{project_name}Model"
+            )
+            daemon_future = executor.submit(
+                self.generate_daemon_template, service_name
+            )
+            database_future = executor.submit(
+                self.generate_database_structure, project_name
+            )
+
+            database_future.result()
+            return (
+                service_future.result(),
+                model_future.result(),
+                daemon_future.result(),
+            )
+
+    def generate_database_structure(
+        self, project_name: str = "Project"
+    ) -> None:
         """
-        return self.db.execute_update(query, (config_key, config_value))
+        Genera la estructura completa de database con queries organizados.
 
+        Crea directorios y archivos base para organizar queries SQL
+        de forma limpia y mantenible, sin migraciones.
 
-# Instancia global para reutilizar
-_update_queries = None
+        Args:
+            project_name: Nombre del proyecto para personalizar archivos
+        """
+        database_dir = os.path.join(os.fspath(self.project_root), "database")
+        queries_dir = os.path.join(database_dir, "queries")
 
-def get_update_queries(config_file: str = "config/config.ini"):
-    """Obtiene instancia singleton de UpdateQueries."""
-    global _update_queries
-    
-    if _update_queries is None:
-        _update_queries = UpdateQueries(config_file)
-        
-    return _update_queries
-'''
+        # Crear directorios solo la primera vez
+        self._ensure_dirs(database_dir, queries_dir)
 
-        (queries_dir / "update_queries.py").write_text(update_content)
-        logger.debug("Archivo update_queries.py creado")
+        # Crear archivos __init__.py
+        self._create_init_files(database_dir, queries_dir)
 
-    def _create_repository_file(
-        self, database_dir: Path, project_name: str
+        # Crear archivos principales; los nombres derivados se calculan
+        # una sola vez para todos los templates
+        names = _project_names(project_name)
+        self._create_connection_file(database_dir)
+        self._create_select_queries_file(queries_dir, names)
+        self._create_update_queries_file(queries_dir, names)
+        self._create_repository_file(database_dir, names)
+        self._create_custom_queries_file(queries_dir, names)
+        self.flush()
+
+        logger.info("Estructura de database creada para %s", project_name)
+
+    def _create_init_files(
+        self, database_dir: str, queries_dir: str
     ) -> None:
-        """Crea el archivo repository.py con patrón Repository."""
-        repository_content = f'''"""
-Repository pattern para {project_name}.
+        """Crea archivos __init__.py para los packages."""
+        database_init = (
+            '"""Database package para queries y conexiones MySQL."""\n'
+        )
+        queries_init = (
+            '"""Queries package para consultas SQL organizadas."""\n'
+        )
 
-Combina SelectQueries y UpdateQueries en una interfaz unificada
-para facilitar el acceso a datos de forma organizada.
-"""
+        self._buffer_write(
+            os.path.join(database_dir, "__init__.py"), database_init
+        )
+        self._buffer_write(
+            os.path.join(queries_dir, "__init__.py"), queries_init
+        )
 
-from typing import Dict, Any, List, Optional
-from .queries.select_queries import get_select_queries
-from .queries.update_queries import get_update_queries
+    def _create_connection_file(self, database_dir: str) -> None:
+        """Crea el archivo connection.py con gestor de conexiones MySQL."""
+        connection_content = _get_template("connection").substitute()
 
+        self._buffer_write(
+            os.path.join(database_dir, "connection.py"), connection_content
+        )
+        logger.debug("Archivo connection.py creado")
 
-class {project_name.title()}Repository:
-    """
-    Repository unificado para acceso a datos de {project_name}.
-    
-    Combina queries de consulta y actualización en una sola interfaz
-    organizada por entidades de negocio.
-    """
-    
-    def __init__(self, config_file: str = "config/config.ini"):
-        """
-        Inicializa el repository.
-        
-        Args:
-            config_file: Archivo de configuración de la BD
-        """
-        self.select = get_select_queries(config_file)
-        self.update = get_update_queries(config_file)
-    
-    # =================================================================
-    # MÉTODOS GENERALES - Para cualquier entidad
-    # =================================================================
-    
-    def get_by_id(self, table_name: str, record_id):
-        """Obtiene un registro por ID de cualquier tabla."""
-        return self.select.get_record_by_id(table_name, record_id)
-    
-    def update_by_id(self, table_name: str, record_id, data: Dict[str, Any]):
-        """Actualiza un registro por ID en cualquier tabla."""
-        return self.update.update_record_by_id(table_name, record_id, data)
-    
-    def create_record(self, table_name: str, data: Dict[str, Any]):
-        """Crea un nuevo registro en cualquier tabla."""
-        return self.update.insert_record(table_name, data)
-    
-    def count_records(self, table_name: str, where_condition: str = None):
-        """Cuenta registros en una tabla."""
-        return self.select.count_records(table_name, where_condition)
-    
-    # =================================================================
-    # MÉTODOS DE SINCRONIZACIÓN - Para control de sync
-    # =================================================================
-    
-    def get_pending_sync(self, table_name: str, limit: int = 100):
-        """Obtiene registros pendientes de sincronización."""
-        return self.select.get_pending_sync_records(table_name, limit)
-    
-    def mark_synced(self, table_name: str, record_id):
-        """Marca un registro como sincronizado."""
-        return self.update.mark_as_synced(table_name, record_id)
-    
-    def mark_sync_failed(self, table_name: str, record_id, error: str):
-        """Marca un registro como fallido en sincronización."""
-        return self.update.mark_sync_failed(table_name, record_id, error)
-    
-    def get_failed_sync_records(self, table_name: str, max_retries: int = 3):
-        """Obtiene registros que fallaron en sincronización."""
-        return self.select.get_failed_sync_records(table_name, max_retries)
-    
-    # =================================================================
-    # MÉTODOS ESPECÍFICOS PARA {project_name.upper()} - Personalizar según negocio
-    # =================================================================
-    
-    def get_active_records(self):
-        """Obtiene registros activos."""
-        return self.select.get_active_records()
-    
-    def update_record_status(self, record_id, new_status: str):
-        """Actualiza el estado de un registro."""
-        return self.update.update_status(record_id, new_status)
-    
-    def get_records_by_date_range(self, start_date: str, end_date: str):
-        """Obtiene registros por rango de fechas."""
-        return self.select.get_records_by_date_range(start_date, end_date)
-    
-    # TODO: Agregar métodos específicos para {project_name}
-    # Ejemplos para diferentes tipos de negocio:
-    # 
-    # PARA E-COMMERCE:
-    # - get_productos_stock_bajo()
-    # - actualizar_inventario()
-    # - get_pedidos_pendientes()
-    # - procesar_pago()
-    #
-    # PARA FACTURACIÓN:
-    # - get_facturas_del_mes()
-    # - crear_factura()
-    # - anular_documento()
-    # - get_clientes_morosos()
-    #
-    # PARA CRM:
-    # - get_clientes_activos()
-    # - actualizar_contacto()
-    # - get_oportunidades_abiertas()
-    # - crear_actividad()
-    
-    # =================================================================
-    # MÉTODOS DE CONFIGURACIÓN
-    # =================================================================
-    
-    def get_config(self, key: str):
-        """Obtiene un valor de configuración."""
-        return self.select.get_config_value(key)
-    
-    def set_config(self, key: str, value: str):
-        """Establece un valor de configuración."""
-        return self.update.set_config_value(key, value)
-    
-    def get_all_configs(self):
-        """Obtiene todas las configuraciones."""
-        return self.select.get_all_configs()
+    def _create_select_queries_file(
+        self, queries_dir: str, names: Dict[str, str]
+    ) -> None:
+        """Crea el archivo select_queries.py con consultas SELECT."""
+        select_content = _get_template("select_queries").substitute(names)
 
+        self._buffer_write(
+            os.path.join(queries_dir, "select_queries.py"), select_content
+        )
+        logger.debug("Archivo select_queries.py creado")
 
-# Instancia global para reutilizar
-_repository = None
+    def _create_update_queries_file(
+        self, queries_dir: str, names: Dict[str, str]
+    ) -> None:
+        """Crea el archivo update_queries.py con consultas de actualización."""
+        update_content = _get_template("update_queries").substitute(names)
 
-def get_repository(config_file: str = "config/config.ini"):
-    """
-    Obtiene una instancia singleton del Repository.
-    
-    Args:
-        config_file: Archivo de configuración
-        
-    Returns:
-        Instancia de {project_name.title()}Repository
-    """
-    global _repository
-    
-    if _repository is None:
-        _repository = {project_name.title()}Repository(config_file)
-        
-    return _repository
-'''
+        self._buffer_write(
+            os.path.join(queries_dir, "update_queries.py"), update_content
+        )
+        logger.debug("Archivo update_queries.py creado")
+
+    def _create_repository_file(
+        self, database_dir: str, names: Dict[str, str]
+    ) -> None:
+        """Crea el archivo repository.py con patrón Repository."""
+        repository_content = _get_template("repository").substitute(names)
 
-        (database_dir / "repository.py").write_text(repository_content)
+        self._buffer_write(
+            os.path.join(database_dir, "repository.py"), repository_content
+        )
         logger.debug("Archivo repository.py creado")
 
     def _create_custom_queries_file(
-        self, queries_dir: Path, project_name: str
+        self, queries_dir: str, names: Dict[str, str]
     ) -> None:
         """Crea archivo custom_queries.py para queries específicos del proyecto."""
-        custom_content = f'''"""
-Queries personalizadas para {project_name}.
+        custom_content = _get_template("custom_queries").substitute(names)
 
-Contiene consultas específicas del dominio de negocio
-que no encajan en las categorías generales.
-"""
-
-from ..connection import get_db_connection
-
-
-class {project_name.title()}CustomQueries:
-    """
-    Queries específicas para el dominio de {project_name}.
-    
-    Implementa consultas complejas y específicas del negocio
-    que requieren lógica particular.
-    """
-    
-    def __init__(self, config_file: str = "config/config.ini"):
-        """
-        Inicializa las queries personalizadas.
-        
-        Args:
-            config_file: Archivo de configuración de la BD
-        """
-        self.db = get_db_connection(config_file)
-    
-    # =================================================================
-    # QUERIES ESPECÍFICAS PARA {project_name.upper()}
-    # =================================================================
-    
-    def get_dashboard_summary(self):
-        """
-        Obtiene resumen para dashboard principal.
-        
-        Returns:
-            Dict con métricas del dashboard
-        """
-        # TODO: Implementar query específico para dashboard
-        query = """
-        SELECT 
-            COUNT(*) as total_records,
-            COUNT(CASE WHEN status = 'active' THEN 1 END) as active_records,
-            COUNT(CASE WHEN status = 'pending' THEN 1 END) as pending_records,
-            MAX(updated_at) as last_update
-        FROM main_table
-        """
-        
-        result = self.db.execute_query(query)
-        return result[0] if result else {{}}
-    
-    def get_monthly_statistics(self, year: int, month: int):
-        """
-        Obtiene estadísticas mensuales.
-        
-        Args:
-            year: Año
-            month: Mes
-            
-        Returns:
-            Lista con estadísticas del mes
-        """
-        # TODO: Implementar query específico para estadísticas
-        query = """
-        SELECT 
-            DATE(created_at) as date,
-            COUNT(*) as daily_count,
-            AVG(amount) as average_amount
-        FROM main_table
-        WHERE YEAR(created_at) = %s 
-        AND MONTH(created_at) = %s
-        GROUP BY DATE(created_at)
-        ORDER BY date
-        """
-        
-        return self.db.execute_query(query, (year, month))
-    
-    def get_complex_report_data(self, start_date: str, end_date: str):
-        """
-        Obtiene datos para reporte complejo.
-        
-        Args:
-            start_date: Fecha de inicio
-            end_date: Fecha de fin
-            
-        Returns:
-            Lista con datos del reporte
-        """
-        # TODO: Implementar query complejo según necesidades
-        query = """
-        SELECT 
-            main_table.id,
-            main_table.name,
-            main_table.status,
-            related_table.description,
-            COUNT(details.id) as detail_count,
-            SUM(details.amount) as total_amount
-        FROM main_table
-        LEFT JOIN related_table ON main_table.related_id = related_table.id
-        LEFT JOIN details ON main_table.id = details.main_id
-        WHERE DATE(main_table.created_at) BETWEEN %s AND %s
-        GROUP BY main_table.id, main_table.name, main_table.status, related_table.description
-        ORDER BY total_amount DESC
-        """
-        
-        return self.db.execute_query(query, (start_date, end_date))
-    
-    # =================================================================
-    # QUERIES DE VALIDACIÓN Y CONTROL
-    # =================================================================
-    
-    def validate_data_integrity(self):
-        """
-        Valida la integridad de los datos.
-        
-        Returns:
-            Lista con problemas encontrados
-        """
-        # TODO: Implementar validaciones específicas
-        queries = [
-            ("duplicate_records", "SELECT id, name, COUNT(*) as count FROM main_table GROUP BY name HAVING count > 1"),
-            ("orphaned_records", "SELECT id FROM details WHERE main_id NOT IN (SELECT id FROM main_table)"),
-            ("invalid_statuses", "SELECT id FROM main_table WHERE status NOT IN ('active', 'inactive', 'pending')")
-        ]
-        
-        issues = []
-        for issue_type, query in queries:
-            results = self.db.execute_query(query)
-            if results:
-                issues.append({{"type": issue_type, "count": len(results), "records": results}})
-        
-        return issues
-    
-    def cleanup_old_records(self, days_old: int = 90):
-        """
-        Limpia registros antiguos (solo SELECT para revisar).
-        
-        Args:
-            days_old: Días de antigüedad
-            
-        Returns:
-            Lista de registros que serían eliminados
-        """
-        query = """
-        SELECT id, name, created_at
-        FROM main_table 
-        WHERE created_at < DATE_SUB(NOW(), INTERVAL %s DAY)
-        AND status = 'inactive'
-        """
-        
-        return self.db.execute_query(query, (days_old,))
-    
-    # =================================================================
-    # PLANTILLAS PARA DIFERENTES TIPOS DE NEGOCIO
-    # =================================================================
-    
-    # EJEMPLO PARA E-COMMERCE
-    def get_low_stock_products(self, threshold: int = 10):
-        """Obtiene productos con stock bajo."""
-        query = """
-        SELECT p.id, p.name, p.stock_current, p.stock_minimum
-        FROM products p
-        WHERE p.stock_current <= %s
-        AND p.active = 1
-        ORDER BY p.stock_current ASC
-        """
-        return self.db.execute_query(query, (threshold,))
-    
-    # EJEMPLO PARA FACTURACIÓN
-    def get_invoice_summary_by_month(self, year: int, month: int):
-        """Obtiene resumen de facturas por mes."""
-        query = """
-        SELECT 
-            COUNT(*) as total_invoices,
-            SUM(total_amount) as total_sales,
-            AVG(total_amount) as average_invoice,
-            COUNT(CASE WHEN status = 'paid' THEN 1 END) as paid_invoices,
-            COUNT(CASE WHEN status = 'pending' THEN 1 END) as pending_invoices
-        FROM invoices
-        WHERE YEAR(invoice_date) = %s AND MONTH(invoice_date) = %s
-        """
-        result = self.db.execute_query(query, (year, month))
-        return result[0] if result else {{}}
-    
-    # EJEMPLO PARA CRM
-    def get_customer_activity_summary(self, customer_id: int, days: int = 30):
-        """Obtiene resumen de actividad de cliente."""
-        query = """
-        SELECT 
-            COUNT(DISTINCT o.id) as total_orders,
-            SUM(o.total_amount) as total_spent,
-            COUNT(DISTINCT c.id) as contacts_made,
-            MAX(o.order_date) as last_order_date,
-            MAX(c.contact_date) as last_contact_date
-        FROM customers cust
-        LEFT JOIN orders o ON cust.id = o.customer_id 
-        LEFT JOIN contacts c ON cust.id = c.customer_id
-        WHERE cust.id = %s
-        AND (o.order_date >= DATE_SUB(NOW(), INTERVAL %s DAY) OR o.order_date IS NULL)
-        AND (c.contact_date >= DATE_SUB(NOW(), INTERVAL %s DAY) OR c.contact_date IS NULL)
-        """
-        result = self.db.execute_query(query, (customer_id, days, days))
-        return result[0] if result else {{}}
-
-
-# Instancia global para reutilizar
-_custom_queries = None
-
-def get_custom_queries(config_file: str = "config/config.ini"):
-    """
-    Obtiene instancia singleton de CustomQueries.
-    
-    Args:
-        config_file: Archivo de configuración
-        
-    Returns:
-        Instancia de {project_name.title()}CustomQueries
-    """
-    global _custom_queries
-    
-    if _custom_queries is None:
-        _custom_queries = {project_name.title()}CustomQueries(config_file)
-        
-    return _custom_queries
-'''
-
-        (queries_dir / "custom_queries.py").write_text(custom_content)
+        self._buffer_write(
+            os.path.join(queries_dir, "custom_queries.py"), custom_content
+        )
         logger.debug("Archivo custom_queries.py creado")
@@ -5,16 +5,34 @@ Proporciona comandos para inicializar proyectos, generar configuraciones,
 y gestionar servicios de sincronización.
 """
 
+import os
 import sys
 from pathlib import Path
 from typing import Optional
 
 import click
 
-from ..build_tools.post_install import PostInstallHooks
-from ..build_tools.project_detector import ProjectDetector
-from ..build_tools.template_generator import TemplateGenerator
-from ..config.builder import ConfigBuilder
+# Los módulos de build_tools y config se importan dentro de cada comando:
+# así --help y los comandos simples no cargan lo que no usan
+
+
+def _is_configured(project_root: Path) -> bool:
+    """
+    Indica si el directorio ya tiene configuración de Tabula Cloud Sync.
+
+    Comprueba el archivo de configuración y, solo si falta, el marcador;
+    con rutas str para no construir objetos Path intermedios.
+
+    Args:
+        project_root: Directorio a comprobar
+
+    Returns:
+        True si existe la configuración o el archivo marcador
+    """
+    root = os.fspath(project_root)
+    return os.path.exists(
+        os.path.join(root, "config", "tabula_config.ini")
+    ) or os.path.exists(os.path.join(root, ".tabula_markers"))
 
 
 @click.group()
@@ -60,6 +78,10 @@ def init(
     Crea la estructura de directorios, archivos de configuración,
     y templates base para comenzar a usar la librería.
     """
+    from ..build_tools.post_install import PostInstallHooks
+    from ..build_tools.template_generator import TemplateGenerator
+    from ..config.builder import ConfigBuilder
+
     click.echo("🚀 Inicializando proyecto Tabula Cloud Sync...")
 
     # Usar el directorio actual de trabajo donde se invoca el comando
@@ -67,10 +89,7 @@ def init(
     click.echo(f"📁 Inicializando en: {project_root}")
 
     # Verificar si ya existe configuración en el directorio actual
-    config_exists = (project_root / "config" / "tabula_config.ini").exists()
-    tabula_marker_exists = (project_root / ".tabula_markers").exists()
-
-    if not force and (config_exists or tabula_marker_exists):
+    if not force and _is_configured(project_root):
         if not click.confirm(
             "Ya existe configuración de Tabula Cloud Sync en este directorio. "
             "¿Continuar?"
@@ -93,32 +112,20 @@ def init(
         config_builder.generate_database_config()
         config_builder.generate_service_config()
 
-        # Generar templates
+        # Generar templates y estructura de database en paralelo
         click.echo("📄 Generando templates de código...")
+        click.echo("🗄️  Generando estructura de database...")
         template_gen = TemplateGenerator(project_root)
 
         # Usar nombres personalizados si se proporcionan
-        actual_service_name = service_name or f"{project_name}Service"
-
-        service_file = template_gen.generate_service_template(
-            service_name=actual_service_name, project_name=project_name
-        )
-        model_file = template_gen.generate_model_template(
-            f"{project_name}Model"
+        service_file, model_file, daemon_file = template_gen.generate_all(
+            project_name, service_name
         )
-        daemon_file = template_gen.generate_daemon_template(
-            actual_service_name
-        )
-
-        # Generar estructura de database
-        click.echo("🗄️  Generando estructura de database...")
-        template_gen.generate_database_structure(project_name)
 
         # Marcar como configurado
-        tabula_marker_file = project_root / ".tabula_markers"
-        with open(tabula_marker_file, "w") as f:
-            f.write(f"configured_at={project_root}\n")
-            f.write("version=1.0.0\n")
+        (project_root / ".tabula_markers").write_text(
+            f"configured_at={project_root}\nversion=1.0.0\n", encoding="utf-8"
+        )
 
         click.echo("✅ Proyecto inicializado exitosamente!")
         click.echo(f"📂 Directorio: {project_root}")
@@ -174,7 +181,8 @@ def validate(config_file: str):
 
 @cli.command()
 @click.argument(
-    "template_type", type=click.Choice(["service", "model", "daemon"])
+    "template_type",
+    type=click.Choice(["service", "model", "daemon", "async-daemon"]),
 )
 @click.option(
     "--name",
@@ -189,8 +197,10 @@ def generate(template_type: str, name: str, output_dir: Optional[str]):
     """
     Genera nuevos templates de código.
 
-    TEMPLATE_TYPE puede ser: service, model, o daemon
+    TEMPLATE_TYPE puede ser: service, model, daemon o async-daemon
     """
+    from ..build_tools.template_generator import TemplateGenerator
+
     click.echo(f"📄 Generando template {template_type}...")
 
     project_root = Path.cwd()
@@ -205,6 +215,8 @@ def generate(template_type: str, name: str, output_dir: Optional[str]):
             output_file = template_gen.generate_model_template(name)
         elif template_type == "daemon":
             output_file = template_gen.generate_daemon_template(name)
+        elif template_type == "async-daemon":
+            output_file = template_gen.generate_async_daemon_template(name)
 
         click.echo(f"✅ Template generado: {output_file}")
 
@@ -214,13 +226,24 @@ def generate(template_type: str, name: str, output_dir: Optional[str]):
 
 
 @cli.command()
-def status():
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Hilos para buscar servicios (por defecto: recorrido secuencial)",
+)
+def status(jobs: Optional[int]):
     """
     Muestra el estado del proyecto y configuración.
 
     Proporciona información sobre la configuración actual,
     servicios detectados, y estado de sincronización.
     """
+    from ..build_tools.project_detector import (
+        ProjectDetector,
+        find_tabula_services,
+    )
+
     click.echo("📊 Estado del proyecto Tabula Cloud Sync")
     click.echo("=" * 50)
 
@@ -244,21 +267,7 @@ def status():
         click.echo("❌ Configuración principal: No encontrada")
 
     # Buscar servicios en el directorio actual
-    services = []
-    python_files = list(project_root.rglob("*.py"))
-
-    for py_file in python_files:
-        try:
-            with open(py_file, "r", encoding="utf-8") as f:
-                content = f.read()
-                if (
-                    "class" in content
-                    and "TabulaCloudService" in content
-                    and "def perform_sync" in content
-                ):
-                    services.append(py_file)
-        except (UnicodeDecodeError, PermissionError):
-            continue
+    services = find_tabula_services(project_root, jobs)
 
     if services:
         click.echo(f"🔧 Servicios encontrados: {len(services)}")
@@ -281,6 +290,8 @@ def configure(environment: str):
 
     Genera archivos de configuración optimizados para diferentes entornos.
     """
+    from ..config.builder import ConfigBuilder
+
     click.echo(f"⚙️  Configurando entorno: {environment}")
 
     project_root = Path.cwd()
@@ -303,13 +314,25 @@ def configure(environment: str):
     default="project_info.json",
     help="Archivo de salida para la información del proyecto",
 )
-def info(output: str):
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Hilos para buscar servicios (por defecto: recorrido secuencial)",
+)
+def info(output: str, jobs: Optional[int]):
     """
     Exporta información detallada del proyecto.
 
     Genera un archivo JSON con toda la información relevante
     del proyecto y su configuración.
     """
+    from ..build_tools.project_detector import (
+        ProjectDetector,
+        find_tabula_services,
+    )
+    from ..utils.commons import get_system_info, save_json_file
+
     click.echo("📋 Recopilando información del proyecto...")
 
     # Usar el directorio actual en lugar del directorio raíz del proyecto
@@ -318,29 +341,11 @@ def info(output: str):
     # Crear un detector temporal para obtener información del proyecto
     detector = ProjectDetector()
 
-    from ..utils.commons import get_system_info, save_json_file
-
     # Verificar si está configurado en el directorio actual
-    config_exists = (project_root / "config" / "tabula_config.ini").exists()
-    tabula_marker_exists = (project_root / ".tabula_markers").exists()
-    is_configured = config_exists or tabula_marker_exists
+    is_configured = _is_configured(project_root)
 
     # Buscar servicios en el directorio actual
-    services = []
-    python_files = list(project_root.rglob("*.py"))
-
-    for py_file in python_files:
-        try:
-            with open(py_file, "r", encoding="utf-8") as f:
-                content = f.read()
-                if (
-                    "class" in content
-                    and "TabulaCloudService" in content
-                    and "def perform_sync" in content
-                ):
-                    services.append(py_file)
-        except (UnicodeDecodeError, PermissionError):
-            continue
+    services = find_tabula_services(project_root, jobs)
 
     project_info = {
         "project": {
@@ -2,22 +2,155 @@
 Builder de configuración para proyectos Tabula Cloud Sync.
 """
 
+import io
 from configparser import ConfigParser
 from pathlib import Path
-
-import yaml
+from typing import Optional
 
 from ..build_tools.project_detector import ProjectDetector
 from ..utils.directories import tabula_dirs
 
+# Secciones fijas de tabula_config.ini
+_API_CONFIG = {
+    "base_url": "https://api.tabula.com.py",
+    "version": "v1",
+    "timeout": "30",
+    "api_key": "YOUR_API_KEY_HERE",
+    "client_id": "YOUR_CLIENT_ID_HERE",
+}
+
+_SYNC_CONFIG = {
+    "interval": "300",  # 5 minutos
+    "batch_size": "100",
+    "retry_attempts": "3",
+    "retry_delay": "10",
+    "auto_start": "true",
+}
+
+# Sección [DATABASE] por motor; los demás usan SQLite
+_DB_MAIN_CONFIG = {
+    "postgresql": {
+        "type": "postgresql",
+        "host": "localhost",
+        "port": "5432",
+        "database": "tabula_sync",
+        "username": "postgres",
+        "password": "YOUR_PASSWORD_HERE",
+    },
+    "mysql": {
+        "type": "mysql",
+        "host": "localhost",
+        "port": "3306",
+        "database": "tabula_sync",
+        "username": "root",
+        "password": "YOUR_PASSWORD_HERE",
+    },
+    "sqlserver": {
+        "type": "sqlserver",
+        "host": "localhost",
+        "port": "1433",
+        "database": "tabula_sync",
+        "username": "sa",
+        "password": "YOUR_PASSWORD_HERE",
+    },
+}
+
+# Sección específica del motor en database_config.yaml
+_DB_EXTRA_CONFIG = {
+    "postgresql": {
+        "driver": "psycopg2",
+        "connection_string_template": (
+            "postgresql+psycopg2://{username}:{password}@{host}:"
+            "{port}/{database}"
+        ),
+        "default_port": 5432,
+        "schema_support": True,
+    },
+    "mysql": {
+        "driver": "pymysql",
+        "connection_string_template": (
+            "mysql+pymysql://{username}:{password}@{host}:"
+            "{port}/{database}"
+        ),
+        "default_port": 3306,
+        "charset": "utf8mb4",
+    },
+    "sqlserver": {
+        "driver": "pymssql",
+        "connection_string_template": (
+            "mssql+pymssql://{username}:{password}@{host}:"
+            "{port}/{database}"
+        ),
+        "default_port": 1433,
+        "schema_support": True,
+    },
+    "sqlite": {
+        "driver": "sqlite",
+        "connection_string_template": "sqlite:///{path}",
+        "wal_mode": True,
+        "foreign_keys": True,
+    },
+}
+
+# Configuración por entorno; los desconocidos usan development
+_ENV_CONFIGS = {
+    "development": {
+        "debug": True,
+        "log_level": "DEBUG",
+        "api_base_url": "https://api-dev.tabula.com.py",
+        "database_echo": True,
+        "sync_interval": 60,
+        "cache_enabled": False,
+    },
+    "testing": {
+        "debug": True,
+        "log_level": "INFO",
+        "api_base_url": "https://api-test.tabula.com.py",
+        "database_echo": False,
+        "sync_interval": 30,
+        "cache_enabled": True,
+    },
+    "production": {
+        "debug": False,
+        "log_level": "WARNING",
+        "api_base_url": "https://api.tabula.com.py",
+        "database_echo": False,
+        "sync_interval": 300,
+        "cache_enabled": True,
+        "ssl_verify": True,
+        "connection_pool_size": 20,
+    },
+}
+
+
+def _write_yaml(data, path: Path) -> None:
+    """
+    Escribe data como YAML en bloque.
+
+    Usa el dumper en C de libyaml cuando PyYAML se compiló con él; si no,
+    el SafeDumper en Python produce el mismo resultado. El documento se
+    arma en memoria y se escribe al archivo de una sola vez.
+    """
+    import yaml
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    path.write_text(
+        yaml.dump(data, Dumper=dumper, default_flow_style=False)
+    )
+
 
 class ConfigBuilder:
     """Constructor de archivos de configuración para proyectos."""
 
-    def __init__(self, project_root: Path, database_type: str = None):
+    def __init__(
+        self,
+        project_root: Path,
+        database_type: str = None,
+        detector: Optional[ProjectDetector] = None,
+    ):
         self.project_root = project_root
         self.config_dir = project_root / "config"
-        self.detector = ProjectDetector()
+        self._detector = detector
         self.database_type = (
             database_type  # Tipo de base de datos especificado
         )
@@ -25,95 +158,63 @@ class ConfigBuilder:
         # Asegurar que existe el directorio de configuración
         self.config_dir.mkdir(exist_ok=True)
 
-    def generate_main_config(self) -> Path:
-        """Genera el archivo de configuración principal."""
-        config = ConfigParser()
+    @property
+    def detector(self) -> ProjectDetector:
+        """Detector del proyecto, creado solo si alguna generación lo usa."""
+        if self._detector is None:
+            self._detector = ProjectDetector()
+        return self._detector
 
-        # Sección de API
-        config.add_section("API")
-        config.set("API", "base_url", "https://api.tabula.com.py")
-        config.set("API", "version", "v1")
-        config.set("API", "timeout", "30")
-        config.set("API", "api_key", "YOUR_API_KEY_HERE")
-        config.set("API", "client_id", "YOUR_CLIENT_ID_HERE")
-
-        # Sección de sincronización
-        config.add_section("SYNC")
-        config.set("SYNC", "interval", "300")  # 5 minutos
-        config.set("SYNC", "batch_size", "100")
-        config.set("SYNC", "retry_attempts", "3")
-        config.set("SYNC", "retry_delay", "10")
-        config.set("SYNC", "auto_start", "true")
-
-        # Sección de base de datos
-        db_type = (
+    def _get_database_type(self) -> str:
+        """Tipo de base de datos indicado, detectado o SQLite por defecto."""
+        return (
             self.database_type
             or self.detector.detect_database_type()
             or "sqlite"
         )
-        config.add_section("DATABASE")
-
-        if db_type == "postgresql":
-            config.set("DATABASE", "type", "postgresql")
-            config.set("DATABASE", "host", "localhost")
-            config.set("DATABASE", "port", "5432")
-            config.set("DATABASE", "database", "tabula_sync")
-            config.set("DATABASE", "username", "postgres")
-            config.set("DATABASE", "password", "YOUR_PASSWORD_HERE")
-        elif db_type == "mysql":
-            config.set("DATABASE", "type", "mysql")
-            config.set("DATABASE", "host", "localhost")
-            config.set("DATABASE", "port", "3306")
-            config.set("DATABASE", "database", "tabula_sync")
-            config.set("DATABASE", "username", "root")
-            config.set("DATABASE", "password", "YOUR_PASSWORD_HERE")
-        elif db_type == "sqlserver":
-            config.set("DATABASE", "type", "sqlserver")
-            config.set("DATABASE", "host", "localhost")
-            config.set("DATABASE", "port", "1433")
-            config.set("DATABASE", "database", "tabula_sync")
-            config.set("DATABASE", "username", "sa")
-            config.set("DATABASE", "password", "YOUR_PASSWORD_HERE")
-        else:
+
+    def generate_main_config(self) -> Path:
+        """Genera el archivo de configuración principal."""
+        db_type = self._get_database_type()
+        database_section = _DB_MAIN_CONFIG.get(db_type)
+        if database_section is None:
             # SQLite por defecto - usar directorio de datos de platformdirs
             sqlite_path = tabula_dirs.get_data_file_path("tabula_sync.db")
-            config.set("DATABASE", "type", "sqlite")
-            config.set("DATABASE", "path", str(sqlite_path))
+            database_section = {"type": "sqlite", "path": str(sqlite_path)}
 
-        # Sección de logging - usar directorio de logs de platformdirs
-        config.add_section("LOGGING")
-        config.set("LOGGING", "level", "INFO")
+        # Logging - usar directorio de logs de platformdirs
         log_path = tabula_dirs.get_log_file_path("tabula_service.log")
-        config.set("LOGGING", "file", str(log_path))
-        config.set("LOGGING", "max_size", "10MB")
-        config.set("LOGGING", "backup_count", "5")
-        config.set(
-            "LOGGING",
-            "format",
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        )
+        project_name = self.project_root.name
 
-        # Sección del servicio
-        config.add_section("SERVICE")
-        config.set(
-            "SERVICE", "name", f"{self.project_root.name}_tabula_service"
-        )
-        config.set(
-            "SERVICE",
-            "display_name",
-            f"{self.project_root.name.title()} Tabula Service",
-        )
-        config.set(
-            "SERVICE",
-            "description",
-            "Servicio de sincronización con Tabula Cloud",
+        config = ConfigParser()
+        config.read_dict(
+            {
+                "API": _API_CONFIG,
+                "SYNC": _SYNC_CONFIG,
+                "DATABASE": database_section,
+                "LOGGING": {
+                    "level": "INFO",
+                    "file": str(log_path),
+                    "max_size": "10MB",
+                    "backup_count": "5",
+                    "format": (
+                        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                    ),
+                },
+                "SERVICE": {
+                    "name": f"{project_name}_tabula_service",
+                    "display_name": f"{project_name.title()} Tabula Service",
+                    "description": "Servicio de sincronización con Tabula Cloud",
+                    "run_as_daemon": "true",
+                },
+            }
         )
-        config.set("SERVICE", "run_as_daemon", "true")
 
         # Guardar configuración
+        buffer = io.StringIO()
+        config.write(buffer)
         config_file = self.config_dir / "tabula_config.ini"
-        with open(config_file, "w") as f:
-            config.write(f)
+        config_file.write_text(buffer.getvalue())
 
         return config_file
 
@@ -174,18 +275,13 @@ class ConfigBuilder:
         }
 
         logging_file = self.config_dir / "logging_config.yaml"
-        with open(logging_file, "w") as f:
-            yaml.dump(logging_config, f, default_flow_style=False)
+        _write_yaml(logging_config, logging_file)
 
         return logging_file
 
     def generate_database_config(self) -> Path:
         """Genera configuración específica de base de datos."""
-        db_type = (
-            self.database_type
-            or self.detector.detect_database_type()
-            or "sqlite"
-        )
+        db_type = self._get_database_type()
 
         db_config = {
             "default": {
@@ -198,47 +294,11 @@ class ConfigBuilder:
             }
         }
 
-        if db_type == "postgresql":
-            db_config["postgresql"] = {
-                "driver": "psycopg2",
-                "connection_string_template": (
-                    "postgresql+psycopg2://{username}:{password}@{host}:"
-                    "{port}/{database}"
-                ),
-                "default_port": 5432,
-                "schema_support": True,
-            }
-        elif db_type == "mysql":
-            db_config["mysql"] = {
-                "driver": "pymysql",
-                "connection_string_template": (
-                    "mysql+pymysql://{username}:{password}@{host}:"
-                    "{port}/{database}"
-                ),
-                "default_port": 3306,
-                "charset": "utf8mb4",
-            }
-        elif db_type == "sqlserver":
-            db_config["sqlserver"] = {
-                "driver": "pymssql",
-                "connection_string_template": (
-                    "mssql+pymssql://{username}:{password}@{host}:"
-                    "{port}/{database}"
-                ),
-                "default_port": 1433,
-                "schema_support": True,
-            }
-        else:
-            db_config["sqlite"] = {
-                "driver": "sqlite",
-                "connection_string_template": "sqlite:///{path}",
-                "wal_mode": True,
-                "foreign_keys": True,
-            }
+        engine = db_type if db_type in _DB_EXTRA_CONFIG else "sqlite"
+        db_config[engine] = _DB_EXTRA_CONFIG[engine]
 
         db_file = self.config_dir / "database_config.yaml"
-        with open(db_file, "w") as f:
-            yaml.dump(db_config, f, default_flow_style=False)
+        _write_yaml(db_config, db_file)
 
         return db_file
 
@@ -273,8 +333,7 @@ class ConfigBuilder:
         }
 
         service_file = self.config_dir / "service_config.yaml"
-        with open(service_file, "w") as f:
-            yaml.dump(service_config, f, default_flow_style=False)
+        _write_yaml(service_config, service_file)
 
         return service_file
 
@@ -282,39 +341,9 @@ class ConfigBuilder:
         self, environment: str = "development"
     ) -> Path:
         """Genera configuración específica del entorno."""
-        env_configs = {
-            "development": {
-                "debug": True,
-                "log_level": "DEBUG",
-                "api_base_url": "https://api-dev.tabula.com.py",
-                "database_echo": True,
-                "sync_interval": 60,
-                "cache_enabled": False,
-            },
-            "testing": {
-                "debug": True,
-                "log_level": "INFO",
-                "api_base_url": "https://api-test.tabula.com.py",
-                "database_echo": False,
-                "sync_interval": 30,
-                "cache_enabled": True,
-            },
-            "production": {
-                "debug": False,
-                "log_level": "WARNING",
-                "api_base_url": "https://api.tabula.com.py",
-                "database_echo": False,
-                "sync_interval": 300,
-                "cache_enabled": True,
-                "ssl_verify": True,
-                "connection_pool_size": 20,
-            },
-        }
-
-        config = env_configs.get(environment, env_configs["development"])
+        config = _ENV_CONFIGS.get(environment, _ENV_CONFIGS["development"])
 
         env_file = self.config_dir / f"environment_{environment}.yaml"
-        with open(env_file, "w") as f:
-            yaml.dump(config, f, default_flow_style=False)
+        _write_yaml(config, env_file)
 
         return env_file
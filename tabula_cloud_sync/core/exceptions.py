@@ -8,6 +8,8 @@ y depuración.
 
 from typing import Any, Dict, Optional
 
+from requests import exceptions as _requests_exc
+
 
 class TabulaCloudException(Exception):
     """Excepción base para todas las excepciones de Tabula Cloud Sync."""
@@ -212,6 +214,46 @@ class BusinessLogicException(TabulaCloudException):
         super().__init__(message, error_code="BUSINESS_LOGIC_ERROR", **kwargs)
 
 
+# Mensajes por código de estado HTTP
+_ERROR_MESSAGES = {
+    400: "Solicitud incorrecta. Verifica los datos proporcionados",
+    401: "Acceso denegado. Usuario o contraseña inválida",
+    403: "Acceso denegado. No tienes permisos para este recurso",
+    404: "Recurso no encontrado",
+    405: "Método no permitido",
+    408: "Tiempo de espera de la solicitud agotado",
+    429: "Demasiadas solicitudes. Inténtalo de nuevo más tarde",
+    500: "Error interno del servidor",
+    502: "Puerta de enlace incorrecta",
+    503: "Servicio no disponible",
+    504: "Tiempo de espera de la puerta de enlace agotado",
+}
+
+# Excepción específica por código de estado; los 5xx restantes se tratan
+# como servicio no disponible y el resto como APIException
+_STATUS_EXCEPTIONS = {
+    401: AuthenticationException,
+    403: AuthorizationException,
+    404: ResourceNotFoundException,
+    429: RateLimitException,
+}
+
+
+# Excepción y prefijo del mensaje por tipo de excepción de requests
+_REQUESTS_EXCEPTIONS = {
+    _requests_exc.SSLError: (ConnectionException, "Error SSL"),
+    _requests_exc.ProxyError: (ConnectionException, "Error del proxy"),
+    _requests_exc.ConnectionError: (ConnectionException, "Error de conexión"),
+    _requests_exc.Timeout: (TimeoutException, "Tiempo de espera agotado"),
+    _requests_exc.HTTPError: (APIException, "Error HTTP"),
+    _requests_exc.TooManyRedirects: (
+        APIException,
+        "Demasiados redireccionamientos",
+    ),
+    _requests_exc.RequestException: (APIException, "Error de solicitud"),
+}
+
+
 # Funciones de utilidad para manejo de excepciones
 def handle_api_error(
     status_code: int, response_data: Optional[Dict[str, Any]] = None
@@ -226,47 +268,19 @@ def handle_api_error(
     Returns:
         Excepción API apropiada
     """
-    error_messages = {
-        400: "Solicitud incorrecta. Verifica los datos proporcionados",
-        401: "Acceso denegado. Usuario o contraseña inválida",
-        403: "Acceso denegado. No tienes permisos para este recurso",
-        404: "Recurso no encontrado",
-        405: "Método no permitido",
-        408: "Tiempo de espera de la solicitud agotado",
-        429: "Demasiadas solicitudes. Inténtalo de nuevo más tarde",
-        500: "Error interno del servidor",
-        502: "Puerta de enlace incorrecta",
-        503: "Servicio no disponible",
-        504: "Tiempo de espera de la puerta de enlace agotado",
-    }
-
-    message = error_messages.get(status_code, f"Error HTTP: {status_code}")
+    message = _ERROR_MESSAGES.get(status_code)
+    if message is None:
+        message = f"Error HTTP: {status_code}"
 
     # Crear excepción específica según el código de estado
-    if status_code == 401:
-        return AuthenticationException(
-            message, details={"status_code": status_code}
-        )
-    elif status_code == 403:
-        return AuthorizationException(
-            message, details={"status_code": status_code}
-        )
-    elif status_code == 404:
-        return ResourceNotFoundException(
-            message, details={"status_code": status_code}
-        )
-    elif status_code == 429:
-        return RateLimitException(
-            message, details={"status_code": status_code}
-        )
-    elif status_code >= 500:
-        return ServiceUnavailableException(
-            message, details={"status_code": status_code}
-        )
-    else:
-        return APIException(
-            message, status_code=status_code, response_data=response_data
-        )
+    exc_class = _STATUS_EXCEPTIONS.get(status_code)
+    if exc_class is None:
+        if status_code < 500:
+            return APIException(
+                message, status_code=status_code, response_data=response_data
+            )
+        exc_class = ServiceUnavailableException
+    return exc_class(message, details={"status_code": status_code})
 
 
 def wrap_requests_exception(exc: Exception) -> TabulaCloudException:
@@ -279,23 +293,17 @@ def wrap_requests_exception(exc: Exception) -> TabulaCloudException:
     Returns:
         Excepción personalizada apropiada
     """
-    import requests
-
-    if isinstance(exc, requests.exceptions.ConnectionError):
-        return ConnectionException(f"Error de conexión: {str(exc)}")
-    elif isinstance(exc, requests.exceptions.Timeout):
-        return TimeoutException(f"Tiempo de espera agotado: {str(exc)}")
-    elif isinstance(exc, requests.exceptions.HTTPError):
-        if hasattr(exc, "response") and exc.response is not None:
-            return handle_api_error(exc.response.status_code)
-        return APIException(f"Error HTTP: {str(exc)}")
-    elif isinstance(exc, requests.exceptions.TooManyRedirects):
-        return APIException(f"Demasiados redireccionamientos: {str(exc)}")
-    elif isinstance(exc, requests.exceptions.SSLError):
-        return ConnectionException(f"Error SSL: {str(exc)}")
-    elif isinstance(exc, requests.exceptions.ProxyError):
-        return ConnectionException(f"Error del proxy: {str(exc)}")
-    elif isinstance(exc, requests.exceptions.RequestException):
-        return APIException(f"Error de solicitud: {str(exc)}")
+    # La clase más específica de la jerarquía de exc decide la conversión
+    for exc_type in type(exc).__mro__:
+        entry = _REQUESTS_EXCEPTIONS.get(exc_type)
+        if entry is not None:
+            break
     else:
         return TabulaCloudException(f"Error desconocido: {str(exc)}")
+
+    if exc_type is _requests_exc.HTTPError:
+        if getattr(exc, "response", None) is not None:
+            return handle_api_error(exc.response.status_code)
+
+    exc_class, prefix = entry
+    return exc_class(f"{prefix}: {str(exc)}")
@@ -29,6 +29,9 @@ class Session:
             "Referer": f"{PROTOCOLO}://{self.domain}",
             "User-Agent": user_agent,
         }
+        # Protocolo, dominio y puerto no cambian: el prefijo se arma una vez
+        puerto = "" if PORT in ("80", "443") else f":{PORT}"
+        self._url_prefix = f"{PROTOCOLO}://{self.domain}{puerto}/"
 
     def __get_url(self, url, tenant=""):
         """
@@ -38,14 +41,7 @@ class Session:
         :param tenant: str, el nombre del inquilino (opcional)
         :return: str, la URL completa del endpoint
         """
-        if tenant:
-            tenant += "."
-        if PORT in ("80", "443"):
-            puerto = ""
-        else:
-            puerto = f":{PORT}"
-
-        return f"{PROTOCOLO}://{self.domain}{puerto}/{url}"
+        return self._url_prefix + url
 
     def _handle_request_exception(self, exc):
         """
@@ -50,6 +50,16 @@ def load_service_class(config_file: str = "config/tabula_config.ini"):
     return create_default_service()
 
 
+# Acciones del daemon indexadas por nombre; las señales solo se registran
+# en ``TabulaCloudDaemon.run``, alcanzado únicamente por start/restart.
+_DAEMON_ACTIONS = {
+    "start": TabulaCloudDaemon.start,
+    "stop": TabulaCloudDaemon.stop,
+    "restart": TabulaCloudDaemon.restart,
+    "status": TabulaCloudDaemon.status,
+}
+
+
 def main():
     """Función principal del manager de servicios."""
     parser = argparse.ArgumentParser(
@@ -59,7 +69,7 @@ def main():
 
     parser.add_argument(
         "action",
-        choices=["start", "stop", "restart", "status", "test"],
+        choices=[*_DAEMON_ACTIONS, "test"],
         help="Acción a realizar",
     )
 
@@ -138,14 +148,7 @@ def main():
                 pidfile=args.pidfile,
             )
 
-            if args.action == "start":
-                daemon.start()
-            elif args.action == "stop":
-                daemon.stop()
-            elif args.action == "restart":
-                daemon.restart()
-            elif args.action == "status":
-                daemon.status()
+            _DAEMON_ACTIONS[args.action](daemon)
 
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -179,6 +179,16 @@ class TestHandleApiError:
         assert exc.status_code == 400
         assert exc.response_data == response_data
 
+    def test_codigo_sin_mensaje_predefinido(self):
+        """Test de códigos sin mensaje propio -> mensaje genérico."""
+        exc = handle_api_error(418)
+        assert isinstance(exc, APIException)
+        assert exc.message == "Error HTTP: 418"
+
+        exc = handle_api_error(599)
+        assert isinstance(exc, ServiceUnavailableException)
+        assert exc.details["status_code"] == 599
+
 
 class TestWrapRequestsException:
     """Test para la función wrap_requests_exception."""
@@ -214,6 +224,7 @@ class TestWrapRequestsException:
         exc = wrap_requests_exception(original_exc)
         assert isinstance(exc, ConnectionException)
         assert "SSL verification failed" in exc.message
+        assert exc.message.startswith("Error SSL")
 
     def test_proxy_error(self):
         """Test de ProxyError -> ConnectionException."""
@@ -221,6 +232,7 @@ class TestWrapRequestsException:
         exc = wrap_requests_exception(original_exc)
         assert isinstance(exc, ConnectionException)
         assert "Proxy failed" in exc.message
+        assert exc.message.startswith("Error del proxy")
 
     def test_too_many_redirects(self):
         """Test de TooManyRedirects -> APIException."""
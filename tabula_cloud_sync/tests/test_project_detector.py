@@ -0,0 +1,50 @@
+"""
+Tests para el detector de proyectos de Tabula Cloud Sync.
+"""
+
+import pytest
+
+from tabula_cloud_sync.build_tools.project_detector import (
+    find_tabula_services,
+)
+
+SERVICE_SOURCE = (
+    "class DemoService(TabulaCloudService):\n"
+    "    def perform_sync(self):\n"
+    "        pass\n"
+)
+
+
+class TestBusquedaServicios:
+    """Test para la detección de servicios en el árbol del proyecto."""
+
+    def test_encuentra_servicios(self, tmp_path):
+        """Detecta servicios en subdirectorios y descarta otros módulos."""
+        (tmp_path / "services").mkdir()
+        (tmp_path / "services" / "demo_service.py").write_text(SERVICE_SOURCE)
+        (tmp_path / "utils.py").write_text("def helper():\n    pass\n")
+
+        services = find_tabula_services(tmp_path)
+        assert [s.name for s in services] == ["demo_service.py"]
+        assert find_tabula_services(tmp_path, jobs=4) == services
+
+    def test_refleja_cambios_en_el_arbol(self, tmp_path):
+        """Cada llamada vuelve a recorrer el árbol."""
+        assert find_tabula_services(tmp_path) == ()
+
+        (tmp_path / "demo_service.py").write_text(SERVICE_SOURCE)
+        assert [s.name for s in find_tabula_services(tmp_path)] == [
+            "demo_service.py"
+        ]
+
+    def test_omite_directorios_ocultos_y_entornos(self, tmp_path):
+        """No entra en directorios ocultos, entornos virtuales ni caches."""
+        for directory in (".venv", "venv", "__pycache__"):
+            (tmp_path / directory).mkdir()
+            (tmp_path / directory / "service.py").write_text(SERVICE_SOURCE)
+
+        assert find_tabula_services(tmp_path) == ()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
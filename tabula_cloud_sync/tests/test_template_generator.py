@@ -0,0 +1,396 @@
+"""
+Tests para el generador de templates de Tabula Cloud Sync.
+"""
+
+import importlib.util
+import os
+import sys
+import types
+
+import pytest
+
+from tabula_cloud_sync.build_tools.template_generator import (
+    _TEMPLATE_FILES,
+    _TEMPLATE_SOURCES,
+    TemplateGenerator,
+    _get_template,
+    _identifiers,
+)
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """Generador apuntando a un directorio temporal."""
+    return TemplateGenerator(tmp_path)
+
+
+class _FakeCursor:
+    """Cursor que registra las sentencias en lugar de enviarlas."""
+
+    def __init__(self, log, prepared=False):
+        self.log = log
+        self.prepared = prepared
+        self.rowcount = -1
+
+    def execute(self, query, params=()):
+        self.log.append(("execute", query, params))
+        self.rowcount = 1
+
+    def executemany(self, query, params_list):
+        self.log.append(("executemany", query, list(params_list)))
+        self.rowcount = len(params_list)
+
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    """Conexión del pool falso; registra commit y rollback."""
+
+    def __init__(self, log):
+        self.log = log
+
+    def cursor(self, prepared=False):
+        self.log.append(("cursor", prepared))
+        return _FakeCursor(self.log, prepared)
+
+    def ping(self, **kwargs):
+        pass
+
+    def commit(self):
+        self.log.append(("commit",))
+
+    def rollback(self):
+        self.log.append(("rollback",))
+
+    def close(self):
+        pass
+
+
+class _FakePool:
+    """Pool falso que guarda la configuración recibida."""
+
+    def __init__(self, pool_name, pool_size, **config):
+        self.config = config
+        self.log = []
+
+    def get_connection(self):
+        return _FakeConnection(self.log)
+
+
+@pytest.fixture
+def fake_mysql(monkeypatch):
+    """Instala un mysql.connector falso que usa _FakePool."""
+    connector = types.ModuleType("mysql.connector")
+    connector.Error = type("Error", (Exception,), {})
+    connector.pooling = types.SimpleNamespace(MySQLConnectionPool=_FakePool)
+    monkeypatch.setitem(sys.modules, "mysql", types.ModuleType("mysql"))
+    monkeypatch.setitem(sys.modules, "mysql.connector", connector)
+
+
+@pytest.fixture
+def db_module(fake_mysql, generator, tmp_path):
+    """Módulo connection.py generado, cargado sobre un driver MySQL falso."""
+    generator.generate_database_structure("demo")
+    path = tmp_path / "database" / "connection.py"
+    spec = importlib.util.spec_from_file_location("demo_connection", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def update_queries_module(fake_mysql, generator, tmp_path, monkeypatch):
+    """Paquete database generado importado; se descarga al terminar."""
+    generator.generate_database_structure("demo")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield importlib.import_module("database.queries.update_queries")
+    for name in [m for m in sys.modules if m.split(".")[0] == "database"]:
+        del sys.modules[name]
+
+
+def _write_mysql_config(path, extra=""):
+    """Escribe un config.ini mínimo con la sección [mysql]."""
+    path.write_text(
+        "[mysql]\nhost = localhost\nport = 3306\n" + extra, encoding="utf-8"
+    )
+    return str(path)
+
+
+class TestTemplatesCompilados:
+    """Test para la caché de templates compilados."""
+
+    def test_template_se_compila_una_vez(self):
+        """Cada tipo de template se construye una sola vez por proceso."""
+        assert _get_template("service") is _get_template("service")
+        assert _get_template("model") is not _get_template("daemon")
+
+    def test_warmup_precarga_templates(self):
+        """warmup deja todos los templates en la caché."""
+        _get_template.cache_clear()
+        TemplateGenerator.warmup()
+        assert _get_template.cache_info().currsize == (
+            len(_TEMPLATE_SOURCES) + len(_TEMPLATE_FILES)
+        )
+
+    def test_templates_en_archivo(self):
+        """Los templates externos se cargan desde el paquete."""
+        for name in _TEMPLATE_FILES:
+            assert "${project_name}" in _get_template(name).template
+
+
+class TestIdentificadores:
+    """Test para la derivación de nombres de clase y módulo."""
+
+    def test_elimina_sufijo_final(self):
+        """El sufijo se elimina solo al final del nombre."""
+        assert _identifiers("ClientesService", "Service") == (
+            "Clientes",
+            "ClientesService",
+            "clientes_service",
+        )
+        assert _identifiers("Productosmodel", "Model")[0] == "Productos"
+
+    def test_conserva_sufijo_intermedio(self):
+        """Un sufijo en medio del nombre no se modifica."""
+        assert _identifiers("MyServiceHandler", "Service")[0] == (
+            "MyServiceHandler"
+        )
+
+
+class TestConexionGenerada:
+    """Test del DatabaseConnection generado contra un driver falso."""
+
+    def test_execute_batch_insert_en_bloques(self, db_module, tmp_path):
+        """Los INSERT van por executemany en bloques, con un solo commit."""
+        db = db_module.DatabaseConnection(
+            _write_mysql_config(tmp_path / "config.ini")
+        )
+        query = "INSERT INTO demo (id, name) VALUES (%s, %s)"
+        params = [(i, "x") for i in range(5)]
+
+        assert db.execute_batch(query, params, chunk_size=2) == 5
+
+        log = db._get_pool().log
+        assert [entry[0] for entry in log] == [
+            "cursor",
+            "executemany",
+            "executemany",
+            "executemany",
+            "commit",
+        ]
+        assert log[0] == ("cursor", False)
+        assert [len(entry[2]) for entry in log[1:4]] == [2, 2, 1]
+
+    def test_execute_batch_update_usa_cursor_preparado(
+        self, db_module, tmp_path
+    ):
+        """Los lotes que no son INSERT se ejecutan sobre un cursor preparado."""
+        db = db_module.DatabaseConnection(
+            _write_mysql_config(tmp_path / "config.ini")
+        )
+        db.execute_batch(
+            "UPDATE demo SET name = %s WHERE code = %s AND id > %s",
+            [("a", "x", 1), ("b", "y", 2)],
+        )
+
+        log = db._get_pool().log
+        assert log[0] == ("cursor", True)
+        assert [entry[0] for entry in log[1:]] == [
+            "execute",
+            "execute",
+            "commit",
+        ]
+
+    def test_execute_batch_update_por_clave_una_sentencia_por_bloque(
+        self, db_module, tmp_path
+    ):
+        """"WHERE id = %s" se envía como IN (...), una sentencia por bloque."""
+        db = db_module.DatabaseConnection(
+            _write_mysql_config(tmp_path / "config.ini")
+        )
+        params = [("synced", i) for i in range(5)] + [("failed", 9)]
+
+        db.execute_batch(
+            "UPDATE demo SET sync_status = %s WHERE id = %s",
+            params,
+            chunk_size=2,
+        )
+
+        executes = [e for e in db._get_pool().log if e[0] == "execute"]
+        assert [(sql.split("WHERE ")[1], args) for _, sql, args in executes] == [
+            ("id IN (%s, %s)", ("synced", 0, 1)),
+            ("id IN (%s, %s)", ("synced", 2, 3)),
+            ("id IN (%s)", ("synced", 4)),
+            ("id IN (%s)", ("failed", 9)),
+        ]
+        assert db._get_pool().log[-1] == ("commit",)
+
+    def test_execute_batch_claves_repetidas_fila_por_fila(
+        self, db_module, tmp_path
+    ):
+        """Con una clave repetida no se reescribe la sentencia."""
+        db = db_module.DatabaseConnection(
+            _write_mysql_config(tmp_path / "config.ini")
+        )
+        query = "UPDATE demo SET retries = retries + 1 WHERE id = %s"
+
+        db.execute_batch(query, [(1,), (2,), (1,)])
+
+        executes = [e for e in db._get_pool().log if e[0] == "execute"]
+        assert [(sql, args) for _, sql, args in executes] == [
+            (query, (1,)),
+            (query, (2,)),
+            (query, (1,)),
+        ]
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [("true", True), ("1", True), ("false", False), ("off", False)],
+    )
+    def test_allow_local_infile_booleano(
+        self, db_module, tmp_path, value, expected
+    ):
+        """allow_local_infile del .ini llega al driver como booleano."""
+        db = db_module.DatabaseConnection(
+            _write_mysql_config(
+                tmp_path / "config.ini", f"allow_local_infile = {value}\n"
+            )
+        )
+        assert db._get_pool().config["allow_local_infile"] is expected
+
+    def test_update_multiple_records_ultimo_valor_por_id(
+        self, update_queries_module, tmp_path
+    ):
+        """Con IDs repetidos gana el último valor, como fila por fila."""
+        queries = update_queries_module.UpdateQueries(
+            _write_mysql_config(tmp_path / "config.ini")
+        )
+        queries.update_multiple_records(
+            "demo", [("pending", 1), ("failed", 2), ("synced", 1)]
+        )
+
+        _, (_, query, params), _ = queries.db._get_pool().log
+        assert query.count("WHEN") == 2
+        assert params == (1, "synced", 2, "failed", 1, 2)
+
+    def test_execute_batch_vacio(self, db_module, tmp_path):
+        """Un lote vacío no abre conexión."""
+        db = db_module.DatabaseConnection(
+            _write_mysql_config(tmp_path / "config.ini")
+        )
+        assert db.execute_batch("DELETE FROM demo WHERE id = %s", []) == 0
+        assert db._connection_pool is None
+
+
+class TestArchivosGenerados:
+    """Test para los archivos de código generados."""
+
+    def test_servicio_generado(self, generator):
+        """Test del archivo de servicio generado."""
+        output_file = generator.generate_service_template(
+            "DemoService", "demo"
+        )
+        content = output_file.read_text()
+
+        assert output_file.name == "demo_service.py"
+        assert "class DemoService(BaseService):" in content
+        assert "sincronización para demo" in content
+
+    def test_modelo_generado(self, generator):
+        """Test del archivo de modelo generado."""
+        output_file = generator.generate_model_template("DemoModel")
+        content = output_file.read_text()
+
+        assert output_file.name == "demo_model.py"
+        assert "class DemoModel(BaseModel):" in content
+        assert "class DemoModelRepository:" in content
+
+    def test_daemon_generado(self, generator):
+        """Test del archivo de daemon generado."""
+        output_file = generator.generate_daemon_template("DemoService")
+        content = output_file.read_text()
+
+        assert output_file.name == "demo_daemon.py"
+        assert "class DemoDaemon(BaseDaemon):" in content
+        assert "# from .demo_service import create_service" in content
+        assert 'logger.info("Daemon Demo detenido")' in content
+
+    def test_daemon_asincrono_generado(self, generator):
+        """Test del daemon asíncrono generado."""
+        output_file = generator.generate_async_daemon_template("DemoService")
+        content = output_file.read_text()
+
+        assert output_file.name == "demo_async_daemon.py"
+        assert "class DemoAsyncDaemon:" in content
+        assert "asyncio.run(daemon.run())" in content
+
+    def test_regenerar_sin_cambios_no_reescribe(self, generator):
+        """Regenerar un archivo idéntico no lo vuelve a escribir."""
+        output_file = generator.generate_model_template("DemoModel")
+        os.utime(output_file, (0, 0))
+
+        generator.generate_model_template("DemoModel")
+        assert output_file.stat().st_mtime == 0
+
+        output_file.write_text("# modificado\n")
+        generator.generate_model_template("DemoModel")
+        assert "class DemoModel(BaseModel):" in output_file.read_text()
+
+    def test_generacion_en_lote(self, generator):
+        """Genera varios servicios y modelos en una sola llamada."""
+        output_files = generator.generate_bulk(
+            ["VentasService", "Compras"], "demo", model_names=["Cliente"]
+        )
+
+        assert [f.name for f in output_files] == [
+            "ventas_service.py",
+            "ventas_daemon.py",
+            "compras_service.py",
+            "compras_daemon.py",
+            "cliente_model.py",
+        ]
+        assert all(f.exists() for f in output_files)
+
+    def test_generacion_en_lote_nombres_repetidos(self, generator):
+        """Un nombre repetido se genera una sola vez y conserva el orden."""
+        output_files = generator.generate_bulk(
+            ["Ventas", "VentasService"], "demo", model_names=["A", "A"]
+        )
+
+        assert [f.name for f in output_files] == [
+            "ventas_service.py",
+            "ventas_daemon.py",
+            "ventas_service.py",
+            "ventas_daemon.py",
+            "a_model.py",
+            "a_model.py",
+        ]
+        assert output_files[0] is output_files[2]
+
+    def test_generacion_completa(self, generator, tmp_path):
+        """generate_all crea servicio, modelo, daemon y database."""
+        service_file, model_file, daemon_file = generator.generate_all("demo")
+
+        assert service_file.name == "demo_service.py"
+        assert model_file.name == "demo_model.py"
+        assert daemon_file.name == "demo_daemon.py"
+        assert (tmp_path / "database" / "queries" / "custom_queries.py").exists()
+
+    def test_archivos_generados_son_python_valido(self, generator, tmp_path):
+        """Todos los archivos generados deben compilar sin errores."""
+        generator.generate_service_template("DemoService", "demo")
+        generator.generate_model_template("DemoModel")
+        generator.generate_daemon_template("DemoService")
+        generator.generate_async_daemon_template("DemoService")
+        generator.generate_database_structure("demo")
+
+        python_files = sorted(tmp_path.rglob("*.py"))
+        assert len(python_files) == 11
+
+        for py_file in python_files:
+            compile(py_file.read_text(), str(py_file), "exec")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
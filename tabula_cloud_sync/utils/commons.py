@@ -2,12 +2,18 @@ import hashlib
 import json
 import os
 import sys
+from functools import lru_cache as _lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
 # Importar ensure_directory mejorada desde directories
 from .directories import ensure_directory as _ensure_directory
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 
 def ensure_directory(path: Union[str, Path]) -> Path:
     """
@@ -91,6 +97,9 @@ def save_json_file(file_path: Union[str, Path], data: Dict[str, Any]) -> bool:
     """
     Guarda un diccionario como archivo JSON de forma segura.
 
+    Si orjson está instalado se usa para serializar (en C); el resultado
+    tiene el mismo formato que json.dump con indent=2.
+
     Args:
         file_path: Ruta del archivo JSON a crear
         data: Diccionario con los datos a guardar
@@ -104,6 +113,11 @@ def save_json_file(file_path: Union[str, Path], data: Dict[str, Any]) -> bool:
         path = Path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        if _orjson is not None:
+            options = _orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS
+            path.write_bytes(_orjson.dumps(data, option=options))
+            return True
+
         with open(path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
         return True
@@ -250,9 +264,18 @@ def get_system_info() -> Dict[str, str]:
     """
     Obtiene información del sistema.
 
+    Los datos no cambian durante la vida del proceso: se consultan una
+    sola vez y cada llamada recibe su propia copia.
+
     Returns:
         Diccionario con información del sistema
     """
+    return dict(_system_info())
+
+
+@_lru_cache(maxsize=1)
+def _system_info() -> Dict[str, str]:
+    """Consulta la información del sistema (ver get_system_info)."""
     import platform
 
     return {